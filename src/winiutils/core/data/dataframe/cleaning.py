@@ -39,6 +39,17 @@ from polars.datatypes.classes import FloatType
 from winiutils.core.data.structures.dicts import reverse_dict
 from winiutils.core.oop.mixins.mixin import ABCLoggingMixin
 
+EAGER_CLEANING_STEPS = (
+    "fill_nulls",
+    "convert_cols",
+    "standard_convert_cols",
+    "custom_convert_cols",
+    "drop_null_subsets",
+    "handle_duplicates",
+    "sort_cols",
+)
+"""tuple[str, ...]: Eager step methods whose overrides disable the lazy pipeline."""
+
 
 class CleaningDF(ABCLoggingMixin):
     """Abstract base class for cleaning and standardizing DataFrames using Polars.
@@ -388,15 +399,58 @@ class CleaningDF(ABCLoggingMixin):
         Note:
             Renaming and dropping columns are done during ``__init__`` before
             this method is called. This method is automatically called during
-            initialization.
+            initialization. Steps 1-5 run as a single lazy query built by
+            ``clean_lazy()``. If a subclass overrides one of the eager step
+            methods (see ``has_eager_step_overrides()``), the steps run one
+            by one instead, so the override is honoured.
         """
-        self.fill_nulls()
-        self.convert_cols()
-        self.drop_null_subsets()
-        self.handle_duplicates()
-        self.sort_cols()
+        if self.has_eager_step_overrides():
+            self.fill_nulls()
+            self.convert_cols()
+            self.drop_null_subsets()
+            self.handle_duplicates()
+            self.sort_cols()
+        else:
+            self.df = self.clean_lazy(self.df.lazy()).collect()
         self.check()
 
+    @classmethod
+    def has_eager_step_overrides(cls) -> bool:
+        """Check whether a subclass overrides one of the eager cleaning steps.
+
+        The eager steps are ``fill_nulls``, ``convert_cols``,
+        ``standard_convert_cols``, ``custom_convert_cols``,
+        ``drop_null_subsets``, ``handle_duplicates`` and ``sort_cols``.
+        Overrides of their ``*_lazy`` counterparts are honoured by both the
+        lazy and the eager pipeline.
+
+        Returns:
+            True if any eager step differs from the ``CleaningDF`` one.
+        """
+        return any(
+            getattr(cls, step) is not getattr(CleaningDF, step)
+            for step in EAGER_CLEANING_STEPS
+        )
+
+    @classmethod
+    def clean_lazy(cls, lf: pl.LazyFrame) -> pl.LazyFrame:
+        """Chain all transforming steps of the pipeline onto a LazyFrame.
+
+        Lazy counterpart of steps 1-5 of ``clean()``. Building one query plan
+        lets Polars fuse the steps and materialize the result only once.
+
+        Args:
+            lf: The LazyFrame with standardized column names and dtypes.
+
+        Returns:
+            LazyFrame that yields the cleaned data once collected.
+        """
+        lf = cls.fill_nulls_lazy(lf)
+        lf = cls.convert_cols_lazy(lf)
+        lf = cls.drop_null_subsets_lazy(lf)
+        lf = cls.handle_duplicates_lazy(lf)
+        return cls.sort_cols_lazy(lf)
+
     @classmethod
     def raise_on_missing_cols(
         cls,
@@ -461,11 +515,28 @@ class CleaningDF(ABCLoggingMixin):
         Raises:
             KeyError: If any columns are missing from the fill null map.
         """
-        self.raise_on_missing_cols(self.get_fill_null_map)
-        self.df = self.df.with_columns(
+        self.df = self.fill_nulls_lazy(self.df.lazy()).collect()
+
+    @classmethod
+    def fill_nulls_lazy(cls, lf: pl.LazyFrame) -> pl.LazyFrame:
+        """Add the null filling to a LazyFrame's query plan.
+
+        Lazy counterpart of ``fill_nulls()``.
+
+        Args:
+            lf: The LazyFrame with standardized column names.
+
+        Returns:
+            LazyFrame with nulls filled from ``get_fill_null_map()``.
+
+        Raises:
+            KeyError: If any columns are missing from the fill null map.
+        """
+        cls.raise_on_missing_cols(cls.get_fill_null_map)
+        return lf.with_columns(
             [
                 pl.col(col_name).fill_null(fill_value)
-                for col_name, fill_value in self.get_fill_null_map().items()
+                for col_name, fill_value in cls.get_fill_null_map().items()
             ],
         )
 
@@ -482,6 +553,25 @@ class CleaningDF(ABCLoggingMixin):
         self.standard_convert_cols()
         self.custom_convert_cols()
 
+    @classmethod
+    def convert_cols_lazy(cls, lf: pl.LazyFrame) -> pl.LazyFrame:
+        """Add the standard and custom conversions to a LazyFrame's query plan.
+
+        Lazy counterpart of ``convert_cols()``.
+
+        Args:
+            lf: The LazyFrame with standardized column names.
+
+        Returns:
+            LazyFrame with all column conversions applied.
+
+        Raises:
+            KeyError: If any columns are missing from the converter map.
+        """
+        cls.raise_on_missing_cols(cls.get_col_converter_map)
+        lf = cls.standard_convert_cols_lazy(lf)
+        return cls.custom_convert_cols_lazy(lf)
+
     def standard_convert_cols(self) -> None:
         """Apply standard conversions based on data type.
 
@@ -489,16 +579,30 @@ class CleaningDF(ABCLoggingMixin):
             - ``pl.Utf8`` columns: Strip leading/trailing whitespace
             - ``pl.Float64`` columns: Round to precision using Kahan summation
         """
-        for col_name, dtype in self.get_col_dtype_map().items():
+        self.df = self.standard_convert_cols_lazy(self.df.lazy()).collect()
+
+    @classmethod
+    def standard_convert_cols_lazy(cls, lf: pl.LazyFrame) -> pl.LazyFrame:
+        """Add the dtype based standard conversions to a LazyFrame's query plan.
+
+        Lazy counterpart of ``standard_convert_cols()``.
+
+        Args:
+            lf: The LazyFrame with standardized column names.
+
+        Returns:
+            LazyFrame with string columns stripped and float columns rounded.
+        """
+        exprs: list[pl.Expr] = []
+        for col_name, dtype in cls.get_col_dtype_map().items():
             if dtype == pl.Utf8:
-                converter = self.strip_col
+                converter = cls.strip_col
             elif dtype == pl.Float64:
-                converter = self.round_col
+                converter = cls.round_col
             else:
                 continue
-            self.df = self.df.with_columns(
-                pl.col(col_name).map_batches(converter, return_dtype=dtype),
-            )
+            exprs.append(pl.col(col_name).map_batches(converter, return_dtype=dtype))
+        return lf.with_columns(exprs)
 
     def custom_convert_cols(self) -> None:
         """Apply custom conversion functions to columns.
@@ -506,14 +610,29 @@ class CleaningDF(ABCLoggingMixin):
         Applies custom transformations from ``get_col_converter_map()`` to each
         column. Columns marked with ``skip_col_converter`` are skipped.
         """
-        self.df = self.df.with_columns(
+        self.df = self.custom_convert_cols_lazy(self.df.lazy()).collect()
+
+    @classmethod
+    def custom_convert_cols_lazy(cls, lf: pl.LazyFrame) -> pl.LazyFrame:
+        """Add the custom conversions to a LazyFrame's query plan.
+
+        Lazy counterpart of ``custom_convert_cols()``.
+
+        Args:
+            lf: The LazyFrame with standardized column names.
+
+        Returns:
+            LazyFrame with the converters from ``get_col_converter_map()``
+            applied.
+        """
+        return lf.with_columns(
             [
                 pl.col(col_name).map_batches(
                     converter,
-                    return_dtype=self.get_col_dtype_map()[col_name],
+                    return_dtype=cls.get_col_dtype_map()[col_name],
                 )
-                for col_name, converter in self.get_col_converter_map().items()
-                if converter.__name__ != self.skip_col_converter.__name__  # ty:ignore[unresolved-attribute]
+                for col_name, converter in cls.get_col_converter_map().items()
+                if converter.__name__ != cls.skip_col_converter.__name__  # ty:ignore[unresolved-attribute]
             ],
         )
 
@@ -619,13 +738,31 @@ class CleaningDF(ABCLoggingMixin):
 
         Applies null-dropping rules defined in ``get_drop_null_subsets()``.
         If no subsets are defined, drops rows where all columns are null.
+        All subsets are applied in a single lazy query via
+        ``drop_null_subsets_lazy()``.
+        """
+        self.df = self.drop_null_subsets_lazy(self.df.lazy()).collect()
+
+    @classmethod
+    def drop_null_subsets_lazy(cls, lf: pl.LazyFrame) -> pl.LazyFrame:
+        """Add the null-dropping rules to a LazyFrame's query plan.
+
+        Lazy counterpart of ``drop_null_subsets()``. Chaining all subsets on
+        a LazyFrame lets Polars execute them in one pass when collected.
+
+        Args:
+            lf: The LazyFrame with standardized column names.
+
+        Returns:
+            LazyFrame that drops rows according to ``get_drop_null_subsets()``
+            once collected.
         """
-        subsets = self.get_drop_null_subsets()
+        subsets = cls.get_drop_null_subsets()
         if not subsets:
-            self.df = self.df.drop_nulls()
-            return
+            return lf.drop_nulls()
         for subset in subsets:
-            self.df = self.df.drop_nulls(subset=subset)
+            lf = lf.drop_nulls(subset=subset)
+        return lf
 
     def handle_duplicates(self) -> None:
         """Remove duplicate rows and aggregate specified columns.
@@ -639,10 +776,27 @@ class CleaningDF(ABCLoggingMixin):
             the 'quantity' column, the result will have one row with
             quantity=3.
         """
-        for subset in self.get_unique_subsets():
-            for col in self.get_add_on_duplicate_cols():
-                self.df = self.df.with_columns(pl.col(col).sum().over(subset))
-            self.df = self.df.unique(subset=subset, keep="first")
+        self.df = self.handle_duplicates_lazy(self.df.lazy()).collect()
+
+    @classmethod
+    def handle_duplicates_lazy(cls, lf: pl.LazyFrame) -> pl.LazyFrame:
+        """Add the duplicate handling to a LazyFrame's query plan.
+
+        Lazy counterpart of ``handle_duplicates()``.
+
+        Args:
+            lf: The LazyFrame with standardized column names.
+
+        Returns:
+            LazyFrame with duplicates aggregated and removed.
+        """
+        add_on_cols = cls.get_add_on_duplicate_cols()
+        for subset in cls.get_unique_subsets():
+            lf = lf.with_columns(
+                [pl.col(col).sum().over(subset) for col in add_on_cols],
+            )
+            lf = lf.unique(subset=subset, keep="first")
+        return lf
 
     def sort_cols(self) -> None:
         """Sort the DataFrame by columns and directions from get_sort_cols().
@@ -650,10 +804,24 @@ class CleaningDF(ABCLoggingMixin):
         Applies multi-column sorting with per-column sort direction
         (ascending or descending) as defined in ``get_sort_cols()``.
         """
-        cols, desc = zip(*self.get_sort_cols(), strict=True)
+        self.df = self.sort_cols_lazy(self.df.lazy()).collect()
+
+    @classmethod
+    def sort_cols_lazy(cls, lf: pl.LazyFrame) -> pl.LazyFrame:
+        """Add the sorting to a LazyFrame's query plan.
+
+        Lazy counterpart of ``sort_cols()``.
+
+        Args:
+            lf: The LazyFrame with standardized column names.
+
+        Returns:
+            LazyFrame sorted by the columns from ``get_sort_cols()``.
+        """
+        cols, desc = zip(*cls.get_sort_cols(), strict=True)
         if not cols:
-            return
-        self.df = self.df.sort(cols, descending=desc)
+            return lf
+        return lf.sort(cols, descending=desc)
 
     def check(self) -> None:
         """Validate data quality after cleaning.
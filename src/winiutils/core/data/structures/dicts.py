@@ -37,4 +37,4 @@ def reverse_dict(d: dict[Any, Any]) -> dict[Any, Any]:
         >>> reverse_dict({"name": "alice", "role": "admin"})
         {'alice': 'name', 'admin': 'role'}
     """
-    return {v: k for k, v in d.items()}
+    return dict(zip(d.values(), d.keys(), strict=True))
@@ -67,7 +67,9 @@ def find_xml_namespaces(xml: str | StringIO) -> dict[str, str]:
 
     Parses the XML content and extracts all namespace prefix-to-URI mappings,
     excluding the default (empty prefix) namespace. Uses defusedxml for safe
-    XML parsing to prevent XML-based attacks.
+    XML parsing to prevent XML-based attacks. The XML is streamed and parsed
+    elements are cleared as soon as they end, so memory stays bounded for
+    large documents.
 
     Args:
         xml: XML content as a string or StringIO object. If a string is
@@ -86,11 +88,15 @@ def find_xml_namespaces(xml: str | StringIO) -> dict[str, str]:
     """
     if not isinstance(xml, StringIO):
         xml = StringIO(xml)
-    # Extract the namespaces from the root tag
+    # Extract the namespace declarations of all tags
     namespaces_: dict[str, str] = {}
-    iter_ns = DefusedElementTree.iterparse(xml, events=["start-ns"])
-    for _, namespace_data in iter_ns:
-        prefix, uri = namespace_data
+    iter_ns = DefusedElementTree.iterparse(xml, events=["start-ns", "end"])
+    for event, data in iter_ns:
+        if event == "end":
+            # only the declarations are needed, so drop the parsed element
+            data.clear()
+            continue
+        prefix, uri = data
         namespaces_[str(prefix)] = str(uri)
 
     namespaces_.pop("", None)
@@ -103,7 +109,7 @@ def value_to_truncated_string(value: object, max_length: int) -> str:
 
     Useful for logging or displaying values where space is limited. The string
     is truncated at word boundaries when possible, with "..." appended to
-    indicate truncation.
+    indicate truncation. Runs of whitespace are collapsed to single spaces.
 
     Args:
         value: Any object to convert to a string representation.
@@ -120,8 +126,13 @@ def value_to_truncated_string(value: object, max_length: int) -> str:
         >>> value_to_truncated_string([1, 2, 3], max_length=20)
         '[1, 2, 3]'
     """
-    string = str(value)
-    return textwrap.shorten(string, width=max_length, placeholder="...")
+    placeholder = "..."
+    # textwrap.shorten collapses whitespace first, doing that ourselves lets
+    # strings that fit skip the much slower wrapping machinery
+    string = " ".join(str(value).split())
+    if len(string) <= max_length and max_length >= len(placeholder):
+        return string
+    return textwrap.shorten(string, width=max_length, placeholder=placeholder)
 
 
 def get_reusable_hash(value: object) -> str:
@@ -136,6 +147,8 @@ def get_reusable_hash(value: object) -> str:
     Args:
         value: Any object to hash. The object's ``__str__`` method is used
             to generate the string representation for hashing.
+            A ``memoryview`` is hashed like the ``bytes`` of its content, as
+            its own string representation is just its memory address.
 
     Returns:
         A 64-character hexadecimal string representation of the SHA-256 hash.
@@ -144,5 +157,8 @@ def get_reusable_hash(value: object) -> str:
         Two objects with the same string representation will produce the same
         hash, even if they are different types or have different internal state.
     """
+    if isinstance(value, memoryview):
+        # tobytes also copies strided views, which have no flat buffer
+        value = value.tobytes()
     value_str = str(value)
     return hashlib.sha256(value_str.encode("utf-8")).hexdigest()
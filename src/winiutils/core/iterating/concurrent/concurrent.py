@@ -15,7 +15,7 @@ Example:
     >>> results = concurrent_loop(
     ...     threading=True,
     ...     process_function=square,
-    ...     process_args=[[1], [2], [3]],
+    ...     process_args=[(1,), (2,), (3,)],
     ...     process_args_len=3,
     ... )
     >>> results
@@ -24,9 +24,11 @@ Example:
 
 import multiprocessing
 import os
+import pickle
 import threading
 from collections.abc import Callable, Generator, Iterable
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from copy import deepcopy
 from functools import partial
 from typing import TYPE_CHECKING, Any, cast
@@ -42,6 +44,8 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+_CPU_COUNT = os.cpu_count() or 1
+
 
 def get_order_and_func_result(
     func_order_args: tuple[Any, ...],
@@ -82,6 +86,11 @@ def generate_process_args(
         2. Appends static arguments to each call
         3. Deep-copies specified arguments for each call (for mutable objects)
 
+    The deep copies are made by unpickling the arguments, which are pickled
+    only once up front. That first pickle round-trip is tried before any
+    arguments are yielded, so arguments that can't be pickled or unpickled
+    fall back to ``copy.deepcopy``.
+
     Args:
         process_function: The function to be executed in parallel.
         process_args: Iterable of argument lists for each parallel call.
@@ -101,7 +110,7 @@ def generate_process_args(
         ...     return a + b + c
         >>> args = generate_process_args(
         ...     process_function=add,
-        ...     process_args=[[1], [2]],
+        ...     process_args=[(1,), (2,)],
         ...     process_args_static=[10],
         ... )
         >>> list(args)
@@ -113,16 +122,31 @@ def generate_process_args(
     deepcopy_static_args = (
         () if deepcopy_static_args is None else tuple(deepcopy_static_args)
     )
+    pickled_static_args: bytes | None = None
+    first_copy: tuple[Any, ...] | None = None
+    try:
+        # unpickling once per call is much cheaper than a deepcopy tree walk
+        pickled_static_args = pickle.dumps(
+            deepcopy_static_args,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        # loading can fail as well, so the first copy is made up front
+        first_copy = pickle.loads(pickled_static_args)  # noqa: S301  # pickled above
+    except Exception:  # noqa: BLE001  # __reduce__ and friends may raise anything
+        pickled_static_args = None
     for order, process_arg in enumerate(process_args):
+        if pickled_static_args is None:
+            static_copies = deepcopy(deepcopy_static_args)
+        elif first_copy is not None:
+            static_copies, first_copy = first_copy, None
+        else:
+            static_copies = pickle.loads(pickled_static_args)  # noqa: S301
         yield (
             process_function,
             order,
             *process_arg,
             *process_args_static,
-            *(
-                deepcopy(deepcopy_static_arg)
-                for deepcopy_static_arg in deepcopy_static_args
-            ),
+            *static_copies,
         )
 
 
@@ -149,8 +173,8 @@ def get_multiprocess_results_with_tqdm(
             used. Affects the progress bar description.
 
     Returns:
-        List of results from parallel execution, sorted by original
-        submission order.
+        List of results from parallel execution, in original submission
+        order.
     """
     results = tqdm(
         results,
@@ -158,12 +182,18 @@ def get_multiprocess_results_with_tqdm(
         desc=f"Multi{'threading' if threads else 'processing'} {process_func}",
         unit=f" {'threads' if threads else 'processes'}",
     )
-    results_list = list(results)
-    # results list is a tuple of (order, result),
-    # so we need to sort it by order to get the original order
-    results_list = sorted(results_list, key=lambda x: x[0])
-    # now extract the results from the tuple
-    return [result[1] for result in results_list]
+    # results are (order, result) tuples, so placing each result at its
+    # order index restores the original order without sorting
+    results_list: list[Any] = [None] * process_args_len
+    count = 0
+    for order, result in results:
+        if order >= len(results_list):
+            # process_args_len is only a hint and may be too small
+            results_list.extend([None] * (order + 1 - len(results_list)))
+        results_list[order] = result
+        count += 1
+    del results_list[count:]
+    return results_list
 
 
 def find_max_pools(
@@ -193,14 +223,12 @@ def find_max_pools(
         For multiprocessing, the maximum is ``cpu_count`` minus active
         child processes.
     """
-    # use tee to find length of process_args
-    cpu_count = os.cpu_count() or 1
     if threads:
         active_tasks = threading.active_count()
-        max_tasks = cpu_count * 4
+        max_tasks = _CPU_COUNT * 4
     else:
         active_tasks = len(multiprocessing.active_children())
-        max_tasks = cpu_count
+        max_tasks = _CPU_COUNT
 
     available_tasks = max_tasks - active_tasks
     max_pools = (
@@ -225,6 +253,7 @@ def concurrent_loop(  # noqa: PLR0913
     process_args_static: Iterable[Any] | None = None,
     deepcopy_static_args: Iterable[Any] | None = None,
     process_args_len: int = 1,
+    executor: "ThreadPoolExecutor | Pool | None" = None,
 ) -> list[Any]:
     """Execute a function concurrently with multiple argument sets.
 
@@ -248,7 +277,11 @@ def concurrent_loop(  # noqa: PLR0913
             for each process. Use this for mutable objects that should not
             be shared between processes. Defaults to None.
         process_args_len: Length of ``process_args``. Used for progress bar
-            and worker pool sizing. Defaults to 1.
+            and worker pool sizing. With 1 or less, the calls run
+            sequentially in the calling thread without a pool. Defaults to 1.
+        executor: Optional running ``ThreadPoolExecutor`` (threading) or
+            spawn ``Pool`` (multiprocessing) to reuse instead of creating a
+            new one. It is not shut down afterwards. Defaults to None.
 
     Returns:
         List of results from the function executions, in the original
@@ -273,18 +306,31 @@ def concurrent_loop(  # noqa: PLR0913
         process_args_static=process_args_static,
         deepcopy_static_args=deepcopy_static_args,
     )
-    max_workers = find_max_pools(threads=threading, process_args_len=process_args_len)
-    pool_executor = (
-        ThreadPoolExecutor(max_workers=max_workers)
-        if threading
-        else get_spawn_pool(processes=max_workers)
-    )
+    if process_args_len <= 1:
+        # a pool only pays off with more than one task, so run it inline
+        return get_multiprocess_results_with_tqdm(
+            results=map(get_order_and_func_result, process_args),
+            process_func=process_function,
+            process_args_len=process_args_len,
+            threads=threading,
+        )
+    if executor is None:
+        max_workers = find_max_pools(
+            threads=threading,
+            process_args_len=process_args_len,
+        )
+        pool_executor = (
+            ThreadPoolExecutor(max_workers=max_workers)
+            if threading
+            else get_spawn_pool(processes=max_workers)
+        )
+    else:
+        # reuse the caller's executor without shutting it down on exit
+        pool_executor = nullcontext(executor)
     with pool_executor as pool:
         map_func: Callable[[Callable[..., Any], Iterable[Any]], Any]
 
-        if process_args_len == 1:
-            map_func = map
-        elif threading:
+        if threading:
             pool = cast("ThreadPoolExecutor", pool)
             map_func = partial(imap_unordered, pool)
         else:
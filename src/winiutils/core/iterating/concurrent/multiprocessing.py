@@ -16,7 +16,7 @@ Example:
     ...     return x * x
     >>> results = multiprocess_loop(
     ...     process_function=square,
-    ...     process_args=[[1], [2], [3]],
+    ...     process_args=[(1,), (2,), (3,)],
     ...     process_args_len=3,
     ... )
     >>> results
@@ -34,6 +34,8 @@ from winiutils.core.iterating.concurrent.concurrent import concurrent_loop
 
 logger = logging.getLogger(__name__)
 
+_spawn_ctx = multiprocessing.get_context("spawn")
+
 
 def get_spawn_pool(*args: Any, **kwargs: Any) -> Pool:  # noqa: ANN401
     """Create a multiprocessing pool with the spawn context.
@@ -54,7 +56,7 @@ def get_spawn_pool(*args: Any, **kwargs: Any) -> Pool:  # noqa: ANN401
         >>> with pool:
         ...     results = pool.map(square, [1, 2, 3])
     """
-    return multiprocessing.get_context("spawn").Pool(*args, **kwargs)
+    return _spawn_ctx.Pool(*args, **kwargs)
 
 
 def cancel_on_timeout(seconds: float, message: str) -> Callable[..., Any]:
@@ -125,12 +127,14 @@ def cancel_on_timeout(seconds: float, message: str) -> Callable[..., Any]:
     return decorator
 
 
-def multiprocess_loop(
+def multiprocess_loop(  # noqa: PLR0913
     process_function: Callable[..., Any],
     process_args: Iterable[Iterable[Any]],
     process_args_static: Iterable[Any] | None = None,
     deepcopy_static_args: Iterable[Any] | None = None,
     process_args_len: int = 1,
+    *,
+    executor: Pool | None = None,
 ) -> list[Any]:
     """Execute a function in parallel using multiprocessing Pool.
 
@@ -151,6 +155,9 @@ def multiprocess_loop(
             be shared between processes. Defaults to None.
         process_args_len: Length of ``process_args``. Used for progress bar
             and worker pool sizing. Defaults to 1.
+        executor: Optional running spawn ``Pool`` to reuse instead of
+            creating a new one per call. It is not shut down afterwards.
+            Defaults to None.
 
     Returns:
         List of results from the function executions, in the original
@@ -170,7 +177,7 @@ def multiprocess_loop(
         ...     return a + b + c
         >>> results = multiprocess_loop(
         ...     process_function=add,
-        ...     process_args=[[1, 2], [3, 4]],
+        ...     process_args=[(1, 2), (3, 4)],
         ...     process_args_static=[10],
         ...     process_args_len=2,
         ... )
@@ -184,4 +191,5 @@ def multiprocess_loop(
         process_args_static=process_args_static,
         deepcopy_static_args=deepcopy_static_args,
         process_args_len=process_args_len,
+        executor=executor,
     )
@@ -18,7 +18,7 @@ Example:
     ...     return requests.get(url).status_code
     >>> results = multithread_loop(
     ...     process_function=fetch_url,
-    ...     process_args=[["https://example.com"], ["https://google.com"]],
+    ...     process_args=[("https://example.com",), ("https://google.com",)],
     ...     process_args_len=2,
     ... )
 """
@@ -60,6 +60,8 @@ def multithread_loop(
     process_args: Iterable[Iterable[Any]],
     process_args_static: Iterable[Any] | None = None,
     process_args_len: int = 1,
+    *,
+    executor: ThreadPoolExecutor | None = None,
 ) -> list[Any]:
     """Execute a function in parallel using ThreadPoolExecutor.
 
@@ -70,11 +72,14 @@ def multithread_loop(
         process_function: The function to execute in parallel.
         process_args: Iterable of argument lists for each parallel call.
             Each inner iterable contains the arguments for one function
-            call. Example: ``[["url1"], ["url2"], ["url3"]]``
+            call. Example: ``[("url1",), ("url2",), ("url3",)]``
         process_args_static: Optional constant arguments to append to each
             call. These are shared across all calls. Defaults to None.
         process_args_len: Length of ``process_args``. Used for progress bar
             and worker pool sizing. Defaults to 1.
+        executor: Optional running ``ThreadPoolExecutor`` to reuse instead of
+            creating a new one per call. It is not shut down afterwards.
+            Defaults to None.
 
     Returns:
         List of results from the function executions, in the original
@@ -92,7 +97,7 @@ def multithread_loop(
         ...     return requests.get(url, timeout=timeout).text
         >>> results = multithread_loop(
         ...     process_function=download,
-        ...     process_args=[["https://example.com"], ["https://google.com"]],
+        ...     process_args=[("https://example.com",), ("https://google.com",)],
         ...     process_args_static=[30],  # 30 second timeout for all
         ...     process_args_len=2,
         ... )
@@ -103,6 +108,7 @@ def multithread_loop(
         process_args=process_args,
         process_args_static=process_args_static,
         process_args_len=process_args_len,
+        executor=executor,
     )
 
 
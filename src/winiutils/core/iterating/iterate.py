@@ -5,7 +5,7 @@ including getting the length of an iterable with a default value.
 These utilities help with iterable operations and manipulations.
 """
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 
@@ -36,10 +36,15 @@ def get_len_with_default(iterable: Iterable[Any], default: int | None = None) ->
         >>> get_len_with_default((x for x in range(10)), default=10)
         10
     """
-    try:
-        return len(iterable)  # type: ignore[arg-type]  # ty:ignore[invalid-argument-type]
-    except TypeError as e:
-        if default is None:
-            msg = "Can't get length of iterable and no default value provided"
-            raise TypeError(msg) from e
-        return default
+    error: TypeError | None = None
+    # plain iterators such as generators are clearly unsized, skipping len()
+    # for them avoids raising and catching a TypeError
+    if not (isinstance(iterable, Iterator) and not hasattr(iterable, "__len__")):
+        try:
+            return len(iterable)  # type: ignore[arg-type]  # ty:ignore[invalid-argument-type]
+        except TypeError as e:
+            error = e
+    if default is None:
+        msg = "Can't get length of iterable and no default value provided"
+        raise TypeError(msg) from error
+    return default
@@ -48,7 +48,8 @@ class ABCLoggingMixin(metaclass=ABCLoggingMeta):
 
     Note:
         - Magic methods (``__init__``, ``__str__``, etc.) are not logged.
-        - Logging is rate-limited to once per second per method.
+        - Logging is rate-limited to once per second per method and thread.
+        - Use ``no_logging`` or ``__no_logging__ = True`` to opt out.
         - This class can be combined with abstract methods since it uses
           ``ABCLoggingMeta`` which extends ``ABCMeta``.
     """
@@ -19,7 +19,9 @@ Example:
 """
 
 import os
+from collections.abc import Iterable, Iterator
 
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 IV_LEN = 12
@@ -28,6 +30,16 @@ IV_LEN = 12
 AES-GCM requires a 12-byte (96-bit) IV for optimal performance and security.
 """
 
+TAG_LEN = 16
+"""int: Length of the authentication tag appended to the ciphertext in bytes."""
+
+STREAM_CHUNK_SIZE = 32 * 1024
+"""int: Number of plaintext bytes fed to the cipher per update when streaming.
+
+Small input chunks are buffered up to this size so the cipher processes
+large blocks at once instead of many tiny ones.
+"""
+
 
 def encrypt_with_aes_gcm(
     aes_gcm: AESGCM,
@@ -59,13 +71,115 @@ def encrypt_with_aes_gcm(
 
     Note:
         A new random IV is generated for each encryption call. Never reuse
-        an IV with the same key.
+        an IV with the same key. Use ``encrypt_with_aes_gcm_into`` to write
+        into a buffer of your own.
     """
     iv = os.urandom(IV_LEN)
     encrypted = aes_gcm.encrypt(iv, data, aad)
     return iv + encrypted
 
 
+def encrypt_with_aes_gcm_into(
+    aes_gcm: AESGCM,
+    data: bytes,
+    out: bytearray | memoryview,
+    aad: bytes | None = None,
+) -> int:
+    """Encrypt data using AES-GCM into a caller-provided buffer.
+
+    Opt-in variant of ``encrypt_with_aes_gcm`` for callers that already own
+    a buffer. Writes the same ``IV + ciphertext`` format to the start of
+    ``out``, so callers that reuse a buffer or write into a larger message
+    avoid allocating the result. ``encrypt_with_aes_gcm`` does not use it,
+    as the extra buffer handling is slower for the usual small payloads.
+
+    Args:
+        aes_gcm: An initialized AESGCM cipher instance.
+        data: The plaintext data to encrypt.
+        out: A writable buffer of at least ``IV_LEN + len(data) + TAG_LEN``
+            bytes. Bytes behind the written range are left untouched.
+        aad: Optional additional authenticated data.
+
+    Returns:
+        The number of bytes written to ``out``.
+
+    Raises:
+        ValueError: If ``out`` is too small for the encrypted data.
+
+    Example:
+        >>> key = AESGCM.generate_key(bit_length=256)
+        >>> aes_gcm = AESGCM(key)
+        >>> out = bytearray(64)
+        >>> n = encrypt_with_aes_gcm_into(aes_gcm, b"hello", out)
+        >>> decrypt_with_aes_gcm(aes_gcm, bytes(out[:n]))
+        b'hello'
+    """
+    size = IV_LEN + len(data) + TAG_LEN
+    if len(out) < size:
+        msg = f"Output buffer has {len(out)} bytes, but {size} are needed"
+        raise ValueError(msg)
+
+    iv = os.urandom(IV_LEN)
+    view = memoryview(out)
+    view[:IV_LEN] = iv
+    aes_gcm.encrypt_into(iv, data, aad, view[IV_LEN:size])
+    return size
+
+
+def encrypt_stream_with_aes_gcm(
+    key: bytes,
+    data: Iterable[bytes],
+    aad: bytes | None = None,
+) -> Iterator[bytes]:
+    """Encrypt a stream of data using AES-GCM with a random initialization vector.
+
+    Streaming counterpart of ``encrypt_with_aes_gcm`` for data that should
+    not be held in memory at once. Input chunks are buffered and encrypted
+    in blocks of ``STREAM_CHUNK_SIZE`` bytes with a single cipher context.
+    Joining the yielded chunks gives the same format as
+    ``encrypt_with_aes_gcm``, so the result can be decrypted with
+    ``decrypt_with_aes_gcm``.
+
+    Args:
+        key: The raw AES key. ``AESGCM`` instances do not expose their key,
+            so the streaming cipher has to be built from the key itself.
+        data: An iterable of plaintext chunks of any size.
+        aad: Optional additional authenticated data.
+
+    Yields:
+        The IV first, then the ciphertext in ``STREAM_CHUNK_SIZE`` blocks,
+        then the remaining ciphertext and finally the authentication tag.
+
+    Example:
+        >>> key = AESGCM.generate_key(bit_length=256)
+        >>> chunks = encrypt_stream_with_aes_gcm(key, [b"hello ", b"world"])
+        >>> decrypt_with_aes_gcm(AESGCM(key), b"".join(chunks))
+        b'hello world'
+
+    Note:
+        Only encryption streams. There is no streaming decryption, as the
+        tag at the end of the stream has to be verified before any
+        plaintext may be used, so ``decrypt_with_aes_gcm`` needs the whole
+        encrypted payload in memory.
+    """
+    iv = os.urandom(IV_LEN)
+    encryptor = Cipher(algorithms.AES(key), modes.GCM(iv)).encryptor()
+    if aad is not None:
+        encryptor.authenticate_additional_data(aad)
+    yield iv
+
+    buf = bytearray()
+    for chunk in data:
+        buf += chunk
+        if len(buf) >= STREAM_CHUNK_SIZE:
+            cut = len(buf) - len(buf) % STREAM_CHUNK_SIZE
+            yield encryptor.update(memoryview(buf)[:cut])
+            del buf[:cut]
+
+    yield b"".join((encryptor.update(buf), encryptor.finalize()))
+    yield encryptor.tag
+
+
 def decrypt_with_aes_gcm(
     aes_gcm: AESGCM,
     data: bytes,
@@ -100,5 +214,6 @@ def decrypt_with_aes_gcm(
         >>> decrypt_with_aes_gcm(aes_gcm, encrypted)
         b'secret'
     """
-    iv, encrypted = data[:IV_LEN], data[IV_LEN:]
-    return aes_gcm.decrypt(iv, encrypted, aad)
+    # slicing a memoryview does not copy the ciphertext
+    view = memoryview(data)
+    return aes_gcm.decrypt(view[:IV_LEN], view[IV_LEN:], aad)
@@ -17,8 +17,11 @@ Example:
 """
 
 import os
+import threading
 from base64 import b64decode, b64encode
 from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
 
 import keyring
 from cryptography.fernet import Fernet
@@ -29,6 +32,9 @@ if os.getenv("GITHUB_ACTIONS", "false") == "true":
 
     keyring.set_keyring(PlaintextKeyring())
 
+_key_cache: dict[tuple[str, str, Callable[[bytes], Any]], tuple[Any, bytes]] = {}
+_key_cache_lock = threading.Lock()
+
 
 def get_or_create_fernet(service_name: str, username: str) -> tuple[Fernet, bytes]:
     """Get or create a Fernet symmetric encryption key from the keyring.
@@ -111,6 +117,10 @@ def get_or_create_key[T](
         service name is modified to include the key class name to allow
         storing different key types for the same service/username.
 
+        Results are cached per ``(service_name, username, key_class)``, so
+        only the first call reaches the keyring. Use
+        ``invalidate_key_cache`` after changing keyring entries directly.
+
     Example:
         >>> from cryptography.fernet import Fernet
         >>> cipher, key = get_or_create_key(
@@ -120,15 +130,49 @@ def get_or_create_key[T](
         ...     Fernet.generate_key,
         ... )
     """
-    key = get_key_as_str(service_name, username, key_class)
-    if key is None:
-        binary_key = generate_key_func()
-        key = b64encode(binary_key).decode("ascii")
-        modified_service_name = make_service_name(service_name, key_class)
-        keyring.set_password(modified_service_name, username, key)
+    cache_key = (service_name, username, key_class)
+    cached = _key_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # the lock prevents two threads from creating different keys for one entry
+    with _key_cache_lock:
+        cached = _key_cache.get(cache_key)
+        if cached is None:
+            binary_key = get_key_as_bytes(service_name, username, key_class)
+            if binary_key is None:
+                binary_key = generate_key_func()
+                key = b64encode(binary_key).decode("ascii")
+                modified_service_name = make_service_name(service_name, key_class)
+                keyring.set_password(modified_service_name, username, key)
+
+            cached = _key_cache[cache_key] = (key_class(binary_key), binary_key)
+    return cached
+
+
+def invalidate_key_cache(
+    service_name: str | None = None,
+    username: str | None = None,
+) -> None:
+    """Drop cached keys so the next lookup reads the keyring again.
 
-    binary_key = b64decode(key)
-    return key_class(binary_key), binary_key
+    Args:
+        service_name: Only drop keys of this service. Drops keys of all
+            services if None.
+        username: Only drop keys of this username. Drops keys of all
+            usernames if None.
+
+    Example:
+        >>> invalidate_key_cache("my_app", "main_key")
+        >>> invalidate_key_cache()  # drop everything
+    """
+    with _key_cache_lock:
+        for cached_service_name, cached_username, key_class in list(_key_cache):
+            if service_name not in (None, cached_service_name):
+                continue
+            if username not in (None, cached_username):
+                continue
+            del _key_cache[cached_service_name, cached_username, key_class]
 
 
 def get_key_as_str[T](
@@ -150,11 +194,32 @@ def get_key_as_str[T](
     return keyring.get_password(service_name, username)
 
 
+def get_key_as_bytes[T](
+    service_name: str,
+    username: str,
+    key_class: Callable[[bytes], T],
+) -> bytes | None:
+    """Retrieve a key from the keyring as raw bytes.
+
+    Args:
+        service_name: The service name used for keyring storage.
+        username: The username/key identifier within the service.
+        key_class: The key class used to modify the service name.
+
+    Returns:
+        The decoded key bytes, or None if the key doesn't exist.
+    """
+    key = get_key_as_str(service_name, username, key_class)
+    return None if key is None else b64decode(key)
+
+
+@lru_cache(maxsize=256)
 def make_service_name[T](service_name: str, key_class: Callable[[bytes], T]) -> str:
     """Create a unique service name by combining service name and key class.
 
     This allows storing different key types (Fernet, AESGCM, etc.) for the
-    same service and username combination.
+    same service and username combination. Results are cached, as the name
+    is built on every keyring access.
 
     Args:
         service_name: The base service name.
@@ -1,12 +1,20 @@
 """Conftest file."""
 
 from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.pool import Pool
 from pathlib import Path
 
 import keyring
 import pytest  # deptry: ignore[DEP004]
 from keyrings.alt.file import PlaintextKeyring  # deptry: ignore[DEP004]
 
+from winiutils.core.iterating.concurrent.multiprocessing import get_spawn_pool
+from winiutils.core.security.keyring import invalidate_key_cache
+
+# tests never submit more than a handful of items at once
+TEST_POOL_WORKERS = 4
+
 
 @pytest.fixture
 def keyring_cleanup(tmp_path: Path) -> Iterator[Callable[[str, str], None]]:
@@ -15,7 +23,8 @@ def keyring_cleanup(tmp_path: Path) -> Iterator[Callable[[str, str], None]]:
     Swaps in a private per-test PlaintextKeyring backend (a file under
     tmp_path) instead of whatever backend is configured for the process, so
     tests never touch a developer's real OS keyring and stay isolated from
-    each other, including across parallel pytest-xdist workers.
+    each other, including across parallel pytest-xdist workers. The key
+    cache is cleared before and after, so no key leaks in from another test.
 
     Usage:
         def test_something(keyring_cleanup):
@@ -26,6 +35,7 @@ def keyring_cleanup(tmp_path: Path) -> Iterator[Callable[[str, str], None]]:
     isolated_keyring = PlaintextKeyring()
     isolated_keyring.file_path = str(tmp_path / "keyring_pass.cfg")  # ty: ignore[invalid-assignment]
     keyring.set_keyring(isolated_keyring)
+    invalidate_key_cache()
 
     entries: list[tuple[str, str]] = []
 
@@ -37,4 +47,27 @@ def keyring_cleanup(tmp_path: Path) -> Iterator[Callable[[str, str], None]]:
     for service_name, username in entries:
         keyring.delete_password(service_name, username)
 
+    invalidate_key_cache()
     keyring.set_keyring(previous_keyring)
+
+
+@pytest.fixture(scope="session")
+def thread_pool() -> Iterator[ThreadPoolExecutor]:
+    """Thread pool shared by all tests of a session.
+
+    Pass it as ``executor`` to the concurrent loops so tests don't pay the
+    pool startup and shutdown cost on every call.
+    """
+    with ThreadPoolExecutor(max_workers=TEST_POOL_WORKERS) as executor:
+        yield executor
+
+
+@pytest.fixture(scope="session")
+def spawn_pool() -> Iterator[Pool]:
+    """Spawn process pool shared by all tests of a session.
+
+    Spawning a worker boots a fresh interpreter, so reusing one pool saves
+    the most time of all shared fixtures.
+    """
+    with get_spawn_pool(processes=TEST_POOL_WORKERS) as pool:
+        yield pool
@@ -1,13 +1,15 @@
 """Tests for winipedia_utils.data.dataframe.cleaning module."""
 
-import random
+import copy
+import inspect
 from collections.abc import Callable
+from functools import cache
 from typing import Any
 
 import polars as pl
 import pytest
 from polars.exceptions import ColumnNotFoundError
-from pytest_mock import MockerFixture
+from pytest_mock import MockerFixture, MockType
 
 from winiutils.core.data.dataframe.cleaning import CleaningDF
 
@@ -22,6 +24,7 @@ class MyCleaningDF(CleaningDF):
     BOOL_COL = "bool_col"
 
     @classmethod
+    @cache
     def get_rename_map(cls) -> dict[str, str]:
         """Test implementation of rename_map."""
         return {
@@ -33,6 +36,7 @@ class MyCleaningDF(CleaningDF):
         }
 
     @classmethod
+    @cache
     def get_col_dtype_map(cls) -> dict[str, type[pl.DataType]]:
         """Test implementation of col_cls_map."""
         return {
@@ -44,11 +48,13 @@ class MyCleaningDF(CleaningDF):
         }
 
     @classmethod
+    @cache
     def get_drop_null_subsets(cls) -> tuple[tuple[str, ...], ...]:
         """Test implementation of drop_null_subsets."""
         return ((cls.STR_COL, cls.INT_COL), (cls.FLOAT_COL, cls.BOOL_COL))
 
     @classmethod
+    @cache
     def get_fill_null_map(cls) -> dict[str, Any]:
         """Test implementation of fill_null_map."""
         return {
@@ -60,21 +66,25 @@ class MyCleaningDF(CleaningDF):
         }
 
     @classmethod
+    @cache
     def get_sort_cols(cls) -> tuple[tuple[str, bool], ...]:
         """Test implementation of sort_cols."""
         return ((cls.INT_COL, False), (cls.STR_COL, True))
 
     @classmethod
+    @cache
     def get_unique_subsets(cls) -> tuple[tuple[str, ...], ...]:
         """Test implementation of unique_subsets."""
         return ((cls.STR_COL, cls.INT_COL), (cls.FLOAT_COL, cls.BOOL_COL))
 
     @classmethod
+    @cache
     def get_no_null_cols(cls) -> tuple[str, ...]:
         """Test implementation of not_null_cols."""
         return (cls.STR_COL, cls.INT_COL)
 
     @classmethod
+    @cache
     def get_col_converter_map(
         cls,
     ) -> dict[str, Callable[[pl.Series], pl.Series]]:
@@ -89,18 +99,30 @@ class MyCleaningDF(CleaningDF):
         }
 
     @classmethod
+    @cache
     def get_add_on_duplicate_cols(cls) -> tuple[str, ...]:
         """Test implementation of add_on_duplicate_cols."""
         return (cls.FLOAT_COL, cls.INT_COL)
 
     @classmethod
+    @cache
     def get_col_precision_map(cls) -> dict[str, int]:
         """Test implementation of col_precision_map."""
         return {cls.FLOAT_COL: 2, cls.FLOAT_COL_2: 2}
 
 
-def get_dirty_data() -> dict[str, list[Any]]:
-    """Get dirty data for testing."""
+class EagerOverrideCleaningDF(MyCleaningDF):
+    """MyCleaningDF that customizes an eager step instead of its lazy hook."""
+
+    def standard_convert_cols(self) -> None:
+        """Upper case the string column on top of the standard conversions."""
+        super().standard_convert_cols()
+        self.df = self.df.with_columns(pl.col(self.STR_COL).str.to_uppercase())
+
+
+@pytest.fixture(scope="session")
+def dirty_data_template() -> dict[str, list[Any]]:
+    """Get dirty data for testing, shared across the session and never mutated."""
     return {
         "str_col_old": ["a", "b", "c"],
         "int_col_old": [0, 1, 2],
@@ -110,28 +132,124 @@ def get_dirty_data() -> dict[str, list[Any]]:
     }
 
 
-def get_cleaning_df() -> CleaningDF:
-    """Get clean data for testing."""
-    return MyCleaningDF(get_dirty_data())
+@pytest.fixture
+def dirty_data(dirty_data_template: dict[str, list[Any]]) -> dict[str, list[Any]]:
+    """Get a fresh copy of the dirty data for tests that mutate it."""
+    return copy.deepcopy(dirty_data_template)
+
+
+@pytest.fixture(scope="session")
+def clean_df_template(dirty_data_template: dict[str, list[Any]]) -> MyCleaningDF:
+    """Get clean data for testing, built once per session and never mutated."""
+    return MyCleaningDF(dirty_data_template)
+
+
+@pytest.fixture
+def clean_df(clean_df_template: MyCleaningDF) -> MyCleaningDF:
+    """Get a copy of the clean data whose df can be mutated by the test."""
+    c_df = copy.copy(clean_df_template)
+    c_df.df = clean_df_template.df.clone()
+    return c_df
+
+
+COL_NAMES = MyCleaningDF.get_col_names()
+COL_DTYPE_MAP = MyCleaningDF.get_col_dtype_map()
+
+
+SPIED_METHODS = (
+    "handle_duplicates_lazy",
+    "sort_cols_lazy",
+    "check_correct_dtypes",
+    "check_no_null_cols",
+    "check_no_nan",
+)
+
+
+@pytest.fixture(scope="module")
+def module_spies(module_mocker: MockerFixture) -> dict[str, MockType]:
+    """Spy on the pipeline methods once for the whole module.
+
+    Classmethods get a plain wrapping mock instead of an autospecced spy,
+    because the latter rebinds inherited classmethods to the instance when
+    they are called via ``self``.
+    """
+    spies: dict[str, MockType] = {}
+    for name in SPIED_METHODS:
+        if isinstance(inspect.getattr_static(MyCleaningDF, name), classmethod):
+            spies[name] = module_mocker.patch.object(
+                MyCleaningDF,
+                name,
+                wraps=getattr(MyCleaningDF, name),
+            )
+        else:
+            spies[name] = module_mocker.spy(MyCleaningDF, name)
+    return spies
+
+
+@pytest.fixture
+def spied_df(
+    module_spies: dict[str, MockType],
+    dirty_data_template: dict[str, list[Any]],
+) -> tuple[dict[str, MockType], MyCleaningDF]:
+    """Reset the module spies and build a clean df whose calls they record."""
+    for spy in module_spies.values():
+        spy.reset_mock()
+    return module_spies, MyCleaningDF(dirty_data_template)
+
+
+def get_dirty_data_len(dirty_data: dict[str, list[Any]]) -> int:
+    """Get the number of rows in the dirty data."""
+    return len(dirty_data[next(iter(dirty_data))])
+
+
+def get_null_row(cleaning_df_cls: type[CleaningDF]) -> pl.DataFrame:
+    """Get a single all-null row typed with the schema of the given CleaningDF."""
+    return pl.DataFrame(
+        {
+            col: pl.Series([None], dtype=dtype)
+            for col, dtype in cleaning_df_cls.get_col_dtype_map().items()
+        },
+    )
+
+
+def get_null_subset_rows(cleaning_df_cls: type[CleaningDF]) -> pl.DataFrame:
+    """Get one row per drop null subset that is null only in that subset."""
+    fill_null_map = cleaning_df_cls.get_fill_null_map()
+    null_row = get_null_row(cleaning_df_cls)
+    return pl.concat(
+        [
+            null_row.with_columns(
+                [
+                    pl.col(col).fill_null(fill_value)
+                    for col, fill_value in fill_null_map.items()
+                    if col not in subset
+                ],
+            )
+            for subset in cleaning_df_cls.get_drop_null_subsets()
+        ],
+    )
 
 
 class TestCleaningDF:
     """Test class for CleaningDF."""
 
-    def test___init__(self) -> None:
+    def test___init__(
+        self,
+        clean_df: MyCleaningDF,
+        dirty_data_template: dict[str, list[Any]],
+    ) -> None:
         """Test method for __init__."""
-        c_df = get_cleaning_df()
         expected = (
-            len(get_dirty_data()[next(iter(get_dirty_data().keys()))]),
-            len(get_dirty_data()),
+            get_dirty_data_len(dirty_data_template),
+            len(dirty_data_template),
         )
-        assert c_df.df.shape == expected, (
-            f"Expected df shape {expected}, got {c_df.df.shape}"
+        assert clean_df.df.shape == expected, (
+            f"Expected df shape {expected}, got {clean_df.df.shape}"
         )
         # test init works with empty data
-        data: dict[str, list[Any]] = {k: [] for k in get_dirty_data()}
+        data: dict[str, list[Any]] = {k: [] for k in dirty_data_template}
         c_df = MyCleaningDF(data)
-        assert c_df.df.shape == (0, len(MyCleaningDF.get_col_names())), (
+        assert c_df.df.shape == (0, len(COL_NAMES)), (
             f"Expected df shape (0, 0), got {c_df.df.shape}"
         )
 
@@ -140,6 +258,56 @@ class TestCleaningDF:
         with pytest.raises(ColumnNotFoundError):
             MyCleaningDF(data)
 
+    @pytest.mark.parametrize(
+        "raw_data",
+        [
+            pytest.param(
+                {
+                    "str_col_old": ["a", "b", "c"],
+                    "int_col_old": ["1", "2", "3"],
+                    "float_col_old": ["1", "2", "3"],
+                    "float_col_2_old": ["1", "2", "3"],
+                    "bool_col_old": [True, False, True],
+                },
+                id="string_values",
+            ),
+            pytest.param(
+                {
+                    "str_col_old": [1, 2, 3],
+                    "int_col_old": [1, 2, 3],
+                    "float_col_old": [1, 2, 3],
+                    "float_col_2_old": [1, 2, 3],
+                    "bool_col_old": [1, 0, 1],
+                },
+                id="int_values",
+            ),
+            pytest.param(
+                {
+                    "str_col_old": ["a", "b", "c"],
+                    "int_col_old": [1.0, 2.0, 3.0],
+                    "float_col_old": [1.0, 2.0, 3.0],
+                    "float_col_2_old": [1.0, 2.0, 3.0],
+                    "bool_col_old": [1, 0, 1],
+                },
+                id="float_values",
+            ),
+        ],
+    )
+    def test___init___casts_dirty_values(self, raw_data: dict[str, list[Any]]) -> None:
+        """Test that __init__ casts raw values of other dtypes to the schema."""
+        for data in (raw_data, pl.DataFrame(raw_data)):
+            c_df = MyCleaningDF(data)
+            assert dict(c_df.df.schema) == COL_DTYPE_MAP, (
+                f"Expected schema {COL_DTYPE_MAP}, got {c_df.df.schema}"
+            )
+            # the int converter adds 1
+            int_values = c_df.df.get_column(MyCleaningDF.INT_COL).to_list()
+            assert int_values == [2, 3, 4], f"Expected [2, 3, 4], got {int_values}"
+
+        # a DataFrame missing a raw column raises like dict input does
+        with pytest.raises(ColumnNotFoundError):
+            MyCleaningDF(pl.DataFrame(raw_data).drop("bool_col_old"))
+
     def test_get_rename_map(self) -> None:
         """Test method for rename_map."""
         rename_map = MyCleaningDF.get_rename_map()
@@ -163,9 +331,9 @@ class TestCleaningDF:
         """Test method for drop_null_subsets."""
         # assert it returns a tuple of tuples with colnames that are in col_names
         drop_null_subsets = MyCleaningDF.get_drop_null_subsets()
-        assert all(
-            c in MyCleaningDF.get_col_dtype_map() for t in drop_null_subsets for c in t
-        ), "Expected all elements in the tuples to be column names"
+        assert all(c in COL_DTYPE_MAP for t in drop_null_subsets for c in t), (
+            "Expected all elements in the tuples to be column names"
+        )
         assert all(isinstance(t, tuple) for t in drop_null_subsets), (
             "Expected drop_null_subsets to return a tuple of tuples"
         )
@@ -173,7 +341,7 @@ class TestCleaningDF:
     def test_get_fill_null_map(self) -> None:
         """Test method for fill_null_map."""
         fill_null_map = MyCleaningDF.get_fill_null_map()
-        assert all(c in MyCleaningDF.get_col_dtype_map() for c in fill_null_map), (
+        assert all(c in COL_DTYPE_MAP for c in fill_null_map), (
             "Expected all keys to be column names"
         )
         assert all(
@@ -183,77 +351,117 @@ class TestCleaningDF:
     def test_get_sort_cols(self) -> None:
         """Test method for sort_cols."""
         sort_cols = MyCleaningDF.get_sort_cols()
-        assert all(c in MyCleaningDF.get_col_dtype_map() for c, _ in sort_cols), (
+        assert all(c in COL_DTYPE_MAP for c, _ in sort_cols), (
             "Expected all elements in the tuples to be column names"
         )
 
     def test_get_unique_subsets(self) -> None:
         """Test method for unique_subsets."""
         unique_subsets = MyCleaningDF.get_unique_subsets()
-        assert all(
-            c in MyCleaningDF.get_col_dtype_map() for t in unique_subsets for c in t
-        ), "Expected all elements in the tuples to be column names"
+        assert all(c in COL_DTYPE_MAP for t in unique_subsets for c in t), (
+            "Expected all elements in the tuples to be column names"
+        )
 
     def test_get_no_null_cols(self) -> None:
         """Test method for not_null_cols."""
         not_null_cols = MyCleaningDF.get_no_null_cols()
-        assert all(c in MyCleaningDF.get_col_dtype_map() for c in not_null_cols), (
+        assert all(c in COL_DTYPE_MAP for c in not_null_cols), (
             "Expected all elements to be column names"
         )
 
     def test_get_col_converter_map(self) -> None:
         """Test method for col_converter_map."""
         col_converter_map = MyCleaningDF.get_col_converter_map()
-        assert all(c in MyCleaningDF.get_col_dtype_map() for c in col_converter_map), (
+        assert all(c in COL_DTYPE_MAP for c in col_converter_map), (
             "Expected all keys to be column names"
         )
 
     def test_get_add_on_duplicate_cols(self) -> None:
         """Test method for add_on_duplicate_cols."""
         add_on_duplicate_cols = MyCleaningDF.get_add_on_duplicate_cols()
-        assert all(
-            c in MyCleaningDF.get_col_dtype_map() for c in add_on_duplicate_cols
-        ), "Expected all elements to be column names"
+        assert all(c in COL_DTYPE_MAP for c in add_on_duplicate_cols), (
+            "Expected all elements to be column names"
+        )
 
     def test_get_col_precision_map(self) -> None:
         """Test method for col_precision_map."""
         col_precision_map = MyCleaningDF.get_col_precision_map()
-        assert all(c in MyCleaningDF.get_col_dtype_map() for c in col_precision_map), (
+        assert all(c in COL_DTYPE_MAP for c in col_precision_map), (
             "Expected all keys to be column names"
         )
         assert all(isinstance(v, int) for v in col_precision_map.values()), (
             "Expected all values to be integers"
         )
 
-    def test_clean(self) -> None:
+    def test_clean(
+        self,
+        clean_df: MyCleaningDF,
+        dirty_data_template: dict[str, list[Any]],
+        mocker: MockerFixture,
+    ) -> None:
         """Test method for clean."""
-        c_df = get_cleaning_df()
         expected = (
-            len(get_dirty_data()[next(iter(get_dirty_data().keys()))]),
-            len(get_dirty_data()),
+            get_dirty_data_len(dirty_data_template),
+            len(dirty_data_template),
+        )
+        assert clean_df.df.shape == expected, (
+            f"Expected df shape {expected}, got {clean_df.df.shape}"
+        )
+
+        # overridden eager steps are run instead of the lazy query
+        clean_lazy = mocker.spy(EagerOverrideCleaningDF, "clean_lazy")
+        c_df = EagerOverrideCleaningDF(dirty_data_template)
+        clean_lazy.assert_not_called()
+        str_values = c_df.df.get_column(MyCleaningDF.STR_COL).to_list()
+        assert str_values == ["A", "B", "C"], (
+            f"Expected the override to upper case the strings, got {str_values}"
         )
         assert c_df.df.shape == expected, (
             f"Expected df shape {expected}, got {c_df.df.shape}"
         )
 
-    def test_rename_cols(self) -> None:
+    def test_has_eager_step_overrides(self) -> None:
+        """Test method for has_eager_step_overrides."""
+        assert not MyCleaningDF.has_eager_step_overrides(), (
+            "Expected no overrides when only the config methods are implemented"
+        )
+        assert EagerOverrideCleaningDF.has_eager_step_overrides(), (
+            "Expected the overridden standard_convert_cols to be detected"
+        )
+
+    def test_clean_lazy(
+        self,
+        clean_df: MyCleaningDF,
+        dirty_data_template: dict[str, list[Any]],
+    ) -> None:
+        """Test method for clean_lazy."""
+        # cleaning already clean data again must not change its shape
+        result = MyCleaningDF.clean_lazy(clean_df.df.lazy())
+        assert isinstance(result, pl.LazyFrame), (
+            f"Expected a LazyFrame, got {type(result)}"
+        )
+        assert result.collect().shape == (
+            get_dirty_data_len(dirty_data_template),
+            len(COL_NAMES),
+        ), "Expected df shape to be the same as before"
+
+    def test_rename_cols(self, clean_df: MyCleaningDF) -> None:
         """Test method for rename_cols."""
-        c_df = get_cleaning_df()
-        assert all(c in c_df.df.columns for c in MyCleaningDF.get_col_dtype_map()), (
+        assert all(c in clean_df.df.columns for c in COL_DTYPE_MAP), (
             "Expected all column names to be renamed"
         )
 
     def test_get_col_names(self) -> None:
         """Test method for get_col_names."""
         col_names = MyCleaningDF.get_col_names()
-        expected = tuple(MyCleaningDF.get_col_dtype_map().keys())
+        expected = tuple(COL_DTYPE_MAP.keys())
         assert col_names == expected, (
             f"Expected col_names to be {expected}, got {col_names}"
         )
 
     def test_raise_on_missing_cols(self) -> None:
         """Test method for raise_on_missing_cols."""
-        incomplete_map = MyCleaningDF.get_col_dtype_map()
+        incomplete_map = dict(COL_DTYPE_MAP)
         missing_key, _ = incomplete_map.popitem()
         missing_keys = {missing_key}
 
@@ -263,61 +471,90 @@ class TestCleaningDF:
         with pytest.raises(KeyError, match=f"{get_incomplete_map}: {missing_keys}"):
             MyCleaningDF.raise_on_missing_cols(get_incomplete_map)
 
-    def test_drop_cols(self) -> None:
+    def test_drop_cols(self, dirty_data: dict[str, list[Any]]) -> None:
         """Test method for drop_cols."""
-        dirty_data = get_dirty_data()
         dirty_data["new_col"] = [1, 2, 3]
         c_df = MyCleaningDF(dirty_data)
         assert "new_col" not in c_df.df.columns, "Expected new_col to be dropped"
 
-    def test_fill_nulls(self) -> None:
+    def test_fill_nulls(self, dirty_data: dict[str, list[Any]]) -> None:
         """Test method for fill_nulls."""
-        dirty_data = get_dirty_data()
         # add a null row to the dirty data
-        for col in dirty_data:
-            dirty_data[col].append(None)
+        for values in dirty_data.values():
+            values.append(None)
         c_df = MyCleaningDF(dirty_data)
         # assert no nulls in the whole df
         null_counts = c_df.df.null_count()
-        assert null_counts.sum_horizontal().item() == 0, (
-            f"Expected no nulls, got {null_counts}"
-        )
+        assert not any(null_counts.row(0)), f"Expected no nulls, got {null_counts}"
 
         # add a null row to the df attr
-        null_row = pl.DataFrame({c: [None] for c in MyCleaningDF.get_col_names()})
+        null_row = get_null_row(MyCleaningDF)
         c_df.df = c_df.df.vstack(null_row)
         c_df.fill_nulls()
-        last_row = c_df.df.tail(1)
+        last_row = c_df.df.row(-1, named=True)
         # assert all the nulls are filled with the fill value
         for col, fill_value in MyCleaningDF.get_fill_null_map().items():
-            last_val = last_row.select(pl.col(col)).item()
+            last_val = last_row[col]
             assert last_val == fill_value, (
                 f"Expected {col} to be filled with {fill_value}, got {last_val}"
             )
 
+    def test_fill_nulls_lazy(self, clean_df: MyCleaningDF) -> None:
+        """Test method for fill_nulls_lazy."""
+        lf = clean_df.df.vstack(get_null_row(MyCleaningDF)).lazy()
+        result = MyCleaningDF.fill_nulls_lazy(lf)
+        assert isinstance(result, pl.LazyFrame), (
+            f"Expected a LazyFrame, got {type(result)}"
+        )
+        last_row = result.collect().row(-1, named=True)
+        assert last_row == MyCleaningDF.get_fill_null_map(), (
+            f"Expected the null row to be filled, got {last_row}"
+        )
+
     @pytest.mark.skip(reason="Only calls other methods")
     def test_convert_cols(self) -> None:
         """Test method for convert_cols."""
 
-    def test_standard_convert_cols(self) -> None:
+    @pytest.mark.skip(reason="Only calls other methods")
+    def test_convert_cols_lazy(self) -> None:
+        """Test method for convert_cols_lazy."""
+
+    def test_standard_convert_cols(self, dirty_data: dict[str, list[Any]]) -> None:
         """Test method for standard_convert_cols."""
         # add whitespace to the string col
-        dirty_data = get_dirty_data()
         dirty_data[MyCleaningDF.STR_COL + "_old"][0] = (
             "  " + dirty_data[MyCleaningDF.STR_COL + "_old"][0] + "  "
         )
         c_df = MyCleaningDF(dirty_data)
         # assert all vals in the string col are stripped
         str_col = c_df.df.select(pl.col(MyCleaningDF.STR_COL)).to_series()
-        assert all(s == s.strip() for s in str_col), (
+        assert str_col.eq(str_col.str.strip_chars()).all(), (
             "Expected all vals in the string col to be stripped"
         )
 
-    def test_custom_convert_cols(self) -> None:
+    def test_standard_convert_cols_lazy(self, clean_df: MyCleaningDF) -> None:
+        """Test method for standard_convert_cols_lazy."""
+        lf = clean_df.df.lazy().with_columns(
+            (" " + pl.col(MyCleaningDF.STR_COL) + " ").alias(MyCleaningDF.STR_COL),
+        )
+        result = MyCleaningDF.standard_convert_cols_lazy(lf)
+        assert isinstance(result, pl.LazyFrame), (
+            f"Expected a LazyFrame, got {type(result)}"
+        )
+        # assert the whitespace is stripped again
+        assert result.collect().equals(clean_df.df), (
+            "Expected the string col to be stripped"
+        )
+
+    def test_custom_convert_cols(
+        self,
+        clean_df: MyCleaningDF,
+        dirty_data_template: dict[str, list[Any]],
+    ) -> None:
         """Test method for custom_convert_cols."""
-        c_df = get_cleaning_df()
+        c_df = clean_df
         # assert the int col is increased by 1
-        before = get_dirty_data()[MyCleaningDF.INT_COL + "_old"]
+        before = dirty_data_template[MyCleaningDF.INT_COL + "_old"]
         after = c_df.df.select(pl.col(MyCleaningDF.INT_COL)).to_series()
         # check overall sum bc of sorting
         assert after.sum() == sum(before) + len(before), (
@@ -331,6 +568,16 @@ class TestCleaningDF:
         for a, b in zip(after, before, strict=True):
             assert a == b + 1, f"Expected {a} to be {b} + 1, got {a} == {b + 1}"
 
+    def test_custom_convert_cols_lazy(self, clean_df: MyCleaningDF) -> None:
+        """Test method for custom_convert_cols_lazy."""
+        result = MyCleaningDF.custom_convert_cols_lazy(clean_df.df.lazy())
+        assert isinstance(result, pl.LazyFrame), (
+            f"Expected a LazyFrame, got {type(result)}"
+        )
+        before = clean_df.df.get_column(MyCleaningDF.INT_COL)
+        after = result.collect().get_column(MyCleaningDF.INT_COL)
+        assert after.eq(before + 1).all(), "Expected the int col to be increased by 1"
+
     def test_strip_col(self) -> None:
         """Test method for strip_col."""
         # make pl.Series with some whitespace
@@ -338,7 +585,7 @@ class TestCleaningDF:
         # strip the whitespace
         without_whitespace = MyCleaningDF.strip_col(with_whitespace)
         # assert all vals are stripped
-        assert all(s == s.strip() for s in without_whitespace), (
+        assert without_whitespace.eq(without_whitespace.str.strip_chars()).all(), (
             "Expected all vals to be stripped"
         )
 
@@ -349,25 +596,23 @@ class TestCleaningDF:
         # lower the case
         lowercase = MyCleaningDF.lower_col(with_uppercase)
         # assert all vals are lowercase
-        assert all(s == s.lower() for s in lowercase), (
+        assert lowercase.eq(lowercase.str.to_lowercase()).all(), (
             "Expected all vals to be lowercase"
         )
 
     def test_round_col(self) -> None:
         """Test method for round_col."""
-        # make a pl.Series with some floats
-        with_floats = pl.Series(
-            # generate a long one with a lot of decimal places
-            name=MyCleaningDF.FLOAT_COL,
-            values=[
-                round(i * 0.123456789, random.randint(1, 10))  # noqa: S311  # nosec: B311
-                for i in range(10000)
-            ],
-        )
+        # make a long pl.Series with floats of 1 to 10 decimal places
+        size = 10000
+        decimals = pl.int_range(size, eager=True).shuffle(seed=0) % 10 + 1
+        scale = 10.0**decimals
+        with_floats = (
+            (pl.int_range(size, eager=True) * 0.123456789 * scale).round() / scale
+        ).alias(MyCleaningDF.FLOAT_COL)
         # round the floats
         rounded = MyCleaningDF.round_col(with_floats, precision=None, compensate=True)
         # assert all vals are rounded
-        assert all(s == round(s, 2) for s in rounded), "Expected all vals to be rounded"
+        assert rounded.eq(rounded.round(2)).all(), "Expected all vals to be rounded"
         # assert the diff in sum is smaller
         # than the smallest number possible with precision in get_col_precision_map
         precision = MyCleaningDF.get_col_precision_map()[MyCleaningDF.FLOAT_COL]
@@ -383,69 +628,76 @@ class TestCleaningDF:
         with pytest.raises(NotImplementedError):
             MyCleaningDF.skip_col_converter(pl.Series([1, 2, 3]))
 
-    def test_drop_null_subsets(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_drop_null_subsets(self, clean_df: MyCleaningDF) -> None:
         """Test method for drop_null_subsets."""
-        dirty_data = get_dirty_data()
-        subsets = MyCleaningDF.get_drop_null_subsets()
-        fill_null_map = MyCleaningDF.get_fill_null_map()
-        for col in MyCleaningDF.get_col_names():
-            for subset in subsets:
-                if col in subset:
-                    dirty_data[col + "_old"].append(None)
-                else:
-                    dirty_data[col + "_old"].append(fill_null_map[col])
-        # overwrite cdf fill nulls to not overwrite the added nulls
-        with monkeypatch.context() as m:
-            m.setattr(MyCleaningDF, "fill_nulls", lambda _self: None)
-            # overwrite standard convert cols to not get math errors when rounding
-            m.setattr(MyCleaningDF, "standard_convert_cols", lambda _self: None)
-
-            c_df = MyCleaningDF(dirty_data)
-            # assert the last rows are dropped and shape is the same as before
-        og_dirty_data = get_dirty_data()
-        assert c_df.df.shape == (
-            len(og_dirty_data[next(iter(og_dirty_data))]),
-            len(MyCleaningDF.get_col_names()),
-        ), "Expected last rows to be dropped"
+        expected_shape = clean_df.df.shape
+        clean_df.df = clean_df.df.vstack(get_null_subset_rows(MyCleaningDF))
+        clean_df.drop_null_subsets()
+        # assert the added rows are dropped and shape is the same as before
+        assert clean_df.df.shape == expected_shape, "Expected last rows to be dropped"
+
+    def test_drop_null_subsets_lazy(self, clean_df: MyCleaningDF) -> None:
+        """Test method for drop_null_subsets_lazy."""
+        lf = clean_df.df.vstack(get_null_subset_rows(MyCleaningDF)).lazy()
+        result = MyCleaningDF.drop_null_subsets_lazy(lf)
+        assert isinstance(result, pl.LazyFrame), (
+            f"Expected a LazyFrame, got {type(result)}"
+        )
+        # assert the added rows are dropped once collected
+        assert result.collect().shape == clean_df.df.shape, (
+            "Expected last rows to be dropped"
+        )
 
-    def test_handle_duplicates(self, mocker: MockerFixture) -> None:
+    def test_handle_duplicates(
+        self,
+        clean_df: MyCleaningDF,
+        dirty_data_template: dict[str, list[Any]],
+    ) -> None:
         """Test method for handle_duplicates."""
-        # test if func gets called once
-
-        spy = mocker.spy(MyCleaningDF, MyCleaningDF.handle_duplicates.__name__)
-        c_df = get_cleaning_df()
-        spy.assert_called_once_with(c_df)
-
+        c_df = clean_df
+        add_on_dup_cols = MyCleaningDF.get_add_on_duplicate_cols()
         # add a duplicate row
         last_row = c_df.df.tail(1)
-        c_df.df = c_df.df.vstack(last_row)
+        c_df.df = pl.concat([c_df.df, last_row], rechunk=False)
         c_df.handle_duplicates()
         # assert the last row is dropped and the values are added together
         # assert df shape is the same as before
         assert c_df.df.shape == (
-            len(get_dirty_data()[next(iter(get_dirty_data()))]),
-            len(MyCleaningDF.get_col_names()),
+            get_dirty_data_len(dirty_data_template),
+            len(COL_NAMES),
         ), "Expected df shape to be the same as before"
 
         # order is not maintained
         # get last_row_after via string col of last row
-        last_row_after = c_df.df.filter(
-            pl.col(MyCleaningDF.STR_COL)
-            == last_row.select(pl.col(MyCleaningDF.STR_COL)).item(),
-        )
-        for col in MyCleaningDF.get_add_on_duplicate_cols():
+        key = last_row.get_column(MyCleaningDF.STR_COL)[0]
+        last_row_after = c_df.df.filter(pl.col(MyCleaningDF.STR_COL) == key)
+        for col in add_on_dup_cols:
             assert (
-                last_row_after.select(pl.col(col)).item()
-                == last_row.select(pl.col(col)).item() * 2
+                last_row_after.get_column(col)[0] == last_row.get_column(col)[0] * 2
             ), f"Expected {col} to be added together"
 
-    def test_sort_cols(self, mocker: MockerFixture) -> None:
-        """Test method for sort_cols."""
-        # assert called once
-        spy = mocker.spy(MyCleaningDF, MyCleaningDF.sort_cols.__name__)
-        c_df = get_cleaning_df()
-        spy.assert_called_once_with(c_df)
+    def test_handle_duplicates_lazy(
+        self,
+        spied_df: tuple[dict[str, MockType], MyCleaningDF],
+    ) -> None:
+        """Test method for handle_duplicates_lazy."""
+        # test if func gets called once
+        spies, c_df = spied_df
+        spies["handle_duplicates_lazy"].assert_called_once()
 
+        lf = c_df.df.vstack(c_df.df).lazy()
+        result = MyCleaningDF.handle_duplicates_lazy(lf)
+        assert isinstance(result, pl.LazyFrame), (
+            f"Expected a LazyFrame, got {type(result)}"
+        )
+        # assert the duplicates are dropped once collected
+        assert result.collect().shape == c_df.df.shape, (
+            "Expected duplicates to be dropped"
+        )
+
+    def test_sort_cols(self, clean_df: MyCleaningDF) -> None:
+        """Test method for sort_cols."""
+        c_df = clean_df
         # int col asc
         # subtract 1 on int col
         first_row = c_df.df.head(1)
@@ -458,46 +710,68 @@ class TestCleaningDF:
         first_row_after = c_df.df.head(1)
         assert first_row_after.equals(new_row), "Expected first row to be the new row"
 
+    def test_sort_cols_lazy(
+        self,
+        spied_df: tuple[dict[str, MockType], MyCleaningDF],
+    ) -> None:
+        """Test method for sort_cols_lazy."""
+        # test if func gets called once
+        spies, c_df = spied_df
+        spies["sort_cols_lazy"].assert_called_once()
+
+        result = MyCleaningDF.sort_cols_lazy(c_df.df.reverse().lazy())
+        assert isinstance(result, pl.LazyFrame), (
+            f"Expected a LazyFrame, got {type(result)}"
+        )
+        # assert the reversed df is sorted again once collected
+        assert result.collect().equals(c_df.df), "Expected df to be sorted"
+
     @pytest.mark.skip(reason="Only calls other methods")
     def test_check(self) -> None:
         """Test method for check."""
 
-    def test_check_correct_dtypes(self, mocker: MockerFixture) -> None:
+    def test_check_correct_dtypes(
+        self,
+        spied_df: tuple[dict[str, MockType], MyCleaningDF],
+    ) -> None:
         """Test method for check_correct_dtypes."""
-        spy = mocker.spy(MyCleaningDF, MyCleaningDF.check_correct_dtypes.__name__)
-        c_df = get_cleaning_df()
-        spy.assert_called_once_with(c_df)
+        spies, c_df = spied_df
+        spies["check_correct_dtypes"].assert_called_once_with(c_df)
 
         # change dtype of int col to float
         c_df.df = c_df.df.with_columns(pl.col(MyCleaningDF.INT_COL).cast(pl.Float64))
         with pytest.raises(TypeError):
             c_df.check_correct_dtypes()
 
-    def test_check_no_null_cols(self, mocker: MockerFixture) -> None:
+    def test_check_no_null_cols(
+        self,
+        spied_df: tuple[dict[str, MockType], MyCleaningDF],
+    ) -> None:
         """Test method for check_no_null_cols."""
-        spy = mocker.spy(MyCleaningDF, MyCleaningDF.check_no_null_cols.__name__)
-        c_df = get_cleaning_df()
-        spy.assert_called_once_with(c_df)
+        spies, c_df = spied_df
+        spies["check_no_null_cols"].assert_called_once_with(c_df)
 
         # add a null row
-        new_row = pl.DataFrame({c: [None] for c in MyCleaningDF.get_col_names()})
+        new_row = get_null_row(MyCleaningDF)
         c_df.df = c_df.df.vstack(new_row)
         with pytest.raises(ValueError, match="Null values found in column"):
             c_df.check_no_null_cols()
 
-    def test_check_no_nan(self, mocker: MockerFixture) -> None:
+    def test_check_no_nan(
+        self,
+        spied_df: tuple[dict[str, MockType], MyCleaningDF],
+    ) -> None:
         """Test method for check_no_nan_cols."""
-        spy = mocker.spy(MyCleaningDF, MyCleaningDF.check_no_nan.__name__)
-        c_df = get_cleaning_df()
-        spy.assert_called_once_with(c_df)
+        spies, c_df = spied_df
+        spies["check_no_nan"].assert_called_once_with(c_df)
 
         # add a nan row where float col get nan and the rest the fill null value
         fill_null_map = MyCleaningDF.get_fill_null_map()
-        new_row = pl.DataFrame(
-            {
-                c: [fill_null_map[c] if c != MyCleaningDF.FLOAT_COL else float("nan")]
-                for c in MyCleaningDF.get_col_names()
-            },
+        new_row = get_null_row(MyCleaningDF).with_columns(
+            [pl.col(c).fill_null(v) for c, v in fill_null_map.items()],
+        )
+        new_row = new_row.with_columns(
+            pl.lit(float("nan"), dtype=pl.Float64).alias(MyCleaningDF.FLOAT_COL),
         )
         c_df.df = c_df.df.vstack(new_row)
         with pytest.raises(ValueError, match="NaN values found in the dataframe"):
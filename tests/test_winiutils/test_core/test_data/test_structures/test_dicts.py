@@ -1,12 +1,36 @@
 """module."""
 
+from typing import Any
+
+import pytest
+
 from winiutils.core.data.structures.dicts import reverse_dict
 
 
-def test_reverse_dict() -> None:
+@pytest.fixture(scope="session")
+def big_dict() -> dict[str, int]:
+    """Get a large dictionary, built once per session."""
+    return {str(i): i for i in range(100_000)}
+
+
+@pytest.mark.parametrize(
+    ("test_dict", "expected"),
+    [
+        pytest.param({"a": 1, "b": 2, "c": 3}, {1: "a", 2: "b", 3: "c"}, id="simple"),
+        pytest.param({}, {}, id="empty"),
+        pytest.param({"a": 1, "b": 1, "c": 2}, {1: "b", 2: "c"}, id="duplicates"),
+    ],
+)
+def test_reverse_dict(test_dict: dict[Any, Any], expected: dict[Any, Any]) -> None:
     """Test func for reverse_dict."""
-    # Test with simple dictionary
-    test_dict = {"a": 1, "b": 2, "c": 3}
-    expected = {1: "a", 2: "b", 3: "c"}
     result = reverse_dict(test_dict)
     assert result == expected, f"Expected {expected}, got {result}"
+
+
+def test_reverse_dict_large(big_dict: dict[str, int]) -> None:
+    """Test reverse_dict with a large dictionary."""
+    result = reverse_dict(big_dict)
+    assert len(result) == len(big_dict), (
+        f"Expected {len(big_dict)} items, got {len(result)}"
+    )
+    assert reverse_dict(result) == big_dict, "Expected reversing twice to round trip"
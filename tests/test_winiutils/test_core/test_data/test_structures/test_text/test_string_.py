@@ -1,8 +1,10 @@
 """Tests for winipedia_utils.text.string_ module."""
 
 import hashlib
+from collections.abc import Callable
 from io import StringIO
 
+import pytest
 from pytest_mock import MockFixture
 
 from winiutils.core.data.structures.text import string_
@@ -13,8 +15,13 @@ from winiutils.core.data.structures.text.string_ import (
     value_to_truncated_string,
 )
 
+HELLO_WORLD_SHA256 = hashlib.sha256(b"Hello, World!").hexdigest()
 
-def test_ask_for_input_with_timeout(mocker: MockFixture) -> None:
+
+def test_ask_for_input_with_timeout(
+    mocker: MockFixture,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """Test func for ask_for_input_with_timeout."""
     # Mock the cancel_on_timeout decorator to avoid multiprocessing issues in tests
     # Must patch where it's used, not where it's defined
@@ -30,17 +37,22 @@ def test_ask_for_input_with_timeout(mocker: MockFixture) -> None:
     mock_cancel_on_timeout.side_effect = simple_decorator
 
     # Test successful input within timeout
-    mock_input = mocker.patch("builtins.input", return_value="test input")
+    prompts: list[str] = []
+
+    def fake_input(prompt: str = "") -> str:
+        prompts.append(prompt)
+        return "test input"
+
+    monkeypatch.setattr("builtins.input", fake_input)
     timeout_seconds = 5
 
     result = ask_for_input_with_timeout("Enter something: ", timeout_seconds)
 
     assert result == "test input", f"Expected 'test input', got '{result}'"
-    mock_input.assert_called_once_with("Enter something: ")
+    assert prompts == ["Enter something: "], f"Expected one prompt, got {prompts}"
 
     # Test with different input
-    mock_input.reset_mock()
-    mock_input.return_value = "different input"
+    monkeypatch.setattr("builtins.input", lambda _prompt="": "different input")
     short_timeout = 1
 
     result = ask_for_input_with_timeout("Enter something: ", short_timeout)
@@ -95,59 +107,53 @@ def test_find_xml_namespaces() -> None:
         f"Expected empty dict (default namespace excluded), got {result}"
     )
 
-
-def test_value_to_truncated_string() -> None:
-    """Test func for value_to_truncated_string."""
-    # Local constants for this test function
-    truncate_length_small = 5
-    truncate_length_medium = 15
-    truncate_length_large = 20
-
-    # Test with short string
-    short_text = "Hello"
-    result = value_to_truncated_string(short_text, 10)
-
-    assert result == "Hello", f"Expected 'Hello', got '{result}'"
-
-    # Test with long string that needs truncation
-    long_text = "This is a very long string that should be truncated"
-    result = value_to_truncated_string(long_text, truncate_length_large)
-
-    assert len(result) <= truncate_length_large, (
-        f"Expected result length <= {truncate_length_large}, got {len(result)}"
-    )
-    assert result.endswith("..."), (
-        f"Expected truncated string to end with '...', got '{result}'"
-    )
-
-    # Test with non-string object
-    test_list = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-    result = value_to_truncated_string(test_list, truncate_length_medium)
-
-    assert len(result) <= truncate_length_medium, (
-        f"Expected result length <= {truncate_length_medium}, got {len(result)}"
+    # Test with namespaces declared on nested elements of a large XML (~100 KB)
+    body = '<ns1:element xmlns:ns1="http://example.com/ns1">content</ns1:element>'
+    large_xml = (
+        '<?xml version="1.0"?>\n<root>'
+        + body * 1500
+        + '<ns2:element xmlns:ns2="http://example.com/ns2"/></root>'
     )
 
-    # Test with exact length
-    exact_text = "Exactly20Characters!"
-    result = value_to_truncated_string(exact_text, truncate_length_large)
-
-    assert result == exact_text, f"Expected '{exact_text}', got '{result}'"
+    result = find_xml_namespaces(large_xml)
 
-    # Test with very small max_length
-    result = value_to_truncated_string("Hello World", truncate_length_small)
-
-    assert len(result) <= truncate_length_small, (
-        f"Expected result length <= {truncate_length_small}, got {len(result)}"
-    )
+    assert result == expected, f"Expected {expected}, got {result}"
 
-    # Test with very small max_length (minimum is 4 for textwrap.shorten with "...")
-    min_width = 4  # Must be larger than placeholder length
-    result = value_to_truncated_string("Hello World", min_width)
 
-    assert len(result) <= min_width, (
-        f"Expected result length <= {min_width}, got {len(result)}"
-    )
+@pytest.mark.parametrize(
+    ("value", "max_length", "is_expected"),
+    [
+        ("Hello", 10, lambda r: r == "Hello"),
+        (
+            "This is a very long string that should be truncated",
+            20,
+            lambda r: len(r) <= 20 and r.endswith("..."),  # noqa: PLR2004
+        ),
+        ([1, 2, 3, 4, 5, 6, 7, 8, 9, 10], 15, lambda r: len(r) <= 15),  # noqa: PLR2004
+        ("Exactly20Characters!", 20, lambda r: r == "Exactly20Characters!"),
+        ("Hello World", 5, lambda r: len(r) <= 5),  # noqa: PLR2004
+        # minimum is 4 for textwrap.shorten with "..."
+        ("Hello World", 4, lambda r: len(r) <= 4),  # noqa: PLR2004
+        (" Hello \n\t World ", 20, lambda r: r == "Hello World"),
+    ],
+    ids=[
+        "short",
+        "long",
+        "non_string",
+        "exact_length",
+        "small",
+        "min_width",
+        "whitespace",
+    ],
+)
+def test_value_to_truncated_string(
+    value: object,
+    max_length: int,
+    is_expected: Callable[[str], bool],
+) -> None:
+    """Test func for value_to_truncated_string."""
+    result = value_to_truncated_string(value, max_length)
+    assert is_expected(result), f"Unexpected result '{result}' for {max_length=}"
 
 
 def test_get_reusable_hash() -> None:
@@ -199,8 +205,27 @@ def test_get_reusable_hash() -> None:
     )
 
     # Verify the hash matches manual calculation
-    expected_hash = hashlib.sha256(test_string.encode("utf-8")).hexdigest()
-    assert result == expected_hash, f"Expected {expected_hash}, got {result}"
+    assert result == HELLO_WORLD_SHA256, f"Expected {HELLO_WORLD_SHA256}, got {result}"
+
+    # Test bytes keep their str based hash, memoryviews hash like their bytes
+    expected_bytes_hash = hashlib.sha256(b"b'Hello, World!'").hexdigest()
+    for bytes_like in (
+        b"Hello, World!",
+        memoryview(b"Hello, World!"),
+        memoryview(b"H-e-l-l-o-,- -W-o-r-l-d-!")[::2],
+    ):
+        bytes_hash = get_reusable_hash(bytes_like)
+        assert bytes_hash == expected_bytes_hash, (
+            f"Expected {expected_bytes_hash} for {bytes_like!r}, got {bytes_hash}"
+        )
+    bytearray_hash = get_reusable_hash(bytearray(b"a"))
+    expected_bytearray_hash = hashlib.sha256(b"bytearray(b'a')").hexdigest()
+    assert bytearray_hash == expected_bytearray_hash, (
+        f"Expected {expected_bytearray_hash}, got {bytearray_hash}"
+    )
+    assert get_reusable_hash(b"a") != get_reusable_hash("a"), (
+        "Expected bytes and str with equal characters to hash differently"
+    )
 
     # Test with None
     none_hash = get_reusable_hash(None)
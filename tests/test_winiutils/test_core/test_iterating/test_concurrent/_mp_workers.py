@@ -0,0 +1,55 @@
+"""Worker functions for the multiprocessing tests.
+
+Spawned pool workers import this module to unpickle the functions, so it
+deliberately imports nothing but the standard library to keep their
+startup cheap.
+"""
+
+import time
+
+
+def quick_function(x: int, y: int = 10) -> int:
+    """Quick function for testing timeout functionality."""
+    return x + y
+
+
+def slow_function() -> str:
+    """Slow function for testing timeout behavior."""
+    time.sleep(0.2)  # Sleep longer than timeout
+    return "completed"
+
+
+def function_with_args(name: str, count: int, multiplier: float = 1.0) -> str:
+    """Function with various argument types for testing."""
+    return f"{name}_{count * multiplier}"
+
+
+def instant_function() -> str:
+    """Instant function for testing zero timeout."""
+    return "instant"
+
+
+def square_function(x: int) -> int:
+    """Square function for testing basic parallel execution."""
+    return x * x
+
+
+def add_function(x: int, y: int) -> int:
+    """Add function for testing static arguments."""
+    return x + y
+
+
+def multiply_function(x: int, y: int, z: int) -> int:
+    """Multiply function for testing multiple arguments."""
+    return x * y * z
+
+
+def append_to_list(item: str, target_list: list[str]) -> list[str]:
+    """Append function for testing deepcopy arguments."""
+    target_list.append(item)
+    return target_list
+
+
+def simple_identity(x: str) -> str:
+    """Identity function for testing process_args_len."""
+    return x
@@ -3,10 +3,22 @@
 This module tests the functionality of the concurrent processing utilities.
 """
 
-import os
-from typing import Any
-
+import builtins
+import inspect
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NoReturn
+
+import pytest
+from pytest_mock import MockerFixture
+
+from winiutils.core.iterating.concurrent import (
+    concurrent,
+    multiprocessing,
+    multithreading,
+)
 from winiutils.core.iterating.concurrent.concurrent import (
+    _CPU_COUNT,
     concurrent_loop,
     find_max_pools,
     generate_process_args,
@@ -15,6 +27,102 @@ from winiutils.core.iterating.concurrent.concurrent import (
 )
 
 
+class PickleRaises:
+    """Object whose pickling raises an error pickle itself never raises."""
+
+    def __reduce__(self) -> NoReturn:
+        """Refuse to be pickled."""
+        msg = "can't be pickled"
+        raise ValueError(msg)
+
+    def __deepcopy__(self, _memo: dict[int, Any]) -> "PickleRaises":
+        """Copy without going through pickling."""
+        return PickleRaises()
+
+
+def raise_value_error() -> NoReturn:
+    """Raise a ValueError, used to fail unpickling."""
+    msg = "can't be unpickled"
+    raise ValueError(msg)
+
+
+class UnpickleRaises:
+    """Object that pickles fine but raises when it is unpickled."""
+
+    def __reduce__(self) -> tuple[Callable[[], NoReturn], tuple[()]]:
+        """Unpickle by calling a function that raises."""
+        return raise_value_error, ()
+
+    def __deepcopy__(self, _memo: dict[int, Any]) -> "UnpickleRaises":
+        """Copy without going through pickling."""
+        return UnpickleRaises()
+
+
+def square(x: int) -> int:
+    """Square a number."""
+    return x * x
+
+
+def add(x: int, y: int) -> int:
+    """Add two numbers."""
+    return x + y
+
+
+def multiply(x: int, y: int, z: int) -> int:
+    """Multiply three numbers."""
+    return x * y * z
+
+
+def identity(x: str) -> str:
+    """Return the input unchanged."""
+    return x
+
+
+LOOP_CASES = [
+    pytest.param(
+        {"process_function": square, "process_args": [(1,), (2,), (3,), (4,), (5,)]},
+        [1, 4, 9, 16, 25],
+        id="basic",
+    ),
+    pytest.param(
+        {
+            "process_function": add,
+            "process_args": [(1,), (2,), (3,)],
+            "process_args_static": [10],
+        },
+        [11, 12, 13],
+        id="static_args",
+    ),
+    pytest.param(
+        {
+            "process_function": multiply,
+            "process_args": [(1, 2, 3), (2, 3, 4), (3, 4, 5)],
+        },
+        [6, 24, 60],
+        id="multiple_args",
+    ),
+    pytest.param(
+        {
+            "process_function": identity,
+            "process_args": [("test1",), ("test2",)],
+            "process_args_len": 2,
+        },
+        ["test1", "test2"],
+        id="process_args_len",
+    ),
+    pytest.param(
+        {"process_function": square, "process_args": [(42,)]},
+        [1764],
+        id="single_item",
+    ),
+    pytest.param(
+        {"process_function": square, "process_args": []},
+        [],
+        id="empty",
+    ),
+]
+
+
 def test_get_order_and_func_result() -> None:
     """Test func for get_order_and_func_result."""
     expected_add_result = 8
@@ -85,63 +193,68 @@ def test_generate_process_args() -> None:
     def test_func(x: int) -> int:
         return x * 2
 
-    process_args = [[1], [2], [3]]
+    process_args = [(1,), (2,), (3,)]
     result_generator = generate_process_args(
         process_function=test_func,
         process_args=process_args,
     )
-    results = list(result_generator)
-
-    assert len(results) == expected_count, (
-        f"Expected {expected_count} results, got {len(results)}"
+    # the args must be generated lazily
+    assert inspect.isgenerator(result_generator), (
+        f"Expected a generator, got {type(result_generator)}"
     )
 
     # Check structure: (function, order, *args)
-    assert results[0][0] == test_func, (
-        f"Expected function {test_func}, got {results[0][0]}"
-    )
-    assert results[0][1] == 0, f"Expected order 0, got {results[0][1]}"
-    assert results[0][2] == 1, f"Expected arg 1, got {results[0][2]}"
-
-    assert results[1][1] == 1, f"Expected order 1, got {results[1][1]}"
-    assert results[1][2] == expected_second_arg, (
-        f"Expected arg {expected_second_arg}, got {results[1][2]}"
+    first = next(result_generator)
+    assert first[0] == test_func, f"Expected function {test_func}, got {first[0]}"
+    assert first[1] == 0, f"Expected order 0, got {first[1]}"
+    assert first[2] == 1, f"Expected arg 1, got {first[2]}"
+
+    second = next(result_generator)
+    assert second[1] == 1, f"Expected order 1, got {second[1]}"
+    assert second[2] == expected_second_arg, (
+        f"Expected arg {expected_second_arg}, got {second[2]}"
+    )
+
+    count = sum(
+        1
+        for _ in generate_process_args(
+            process_function=test_func,
+            process_args=process_args,
+        )
     )
+    assert count == expected_count, f"Expected {expected_count} results, got {count}"
 
     # Test with static arguments
-    process_args = [[1], [2]]
+    process_args = [(1,), (2,)]
     static_args = [expected_static_int, "static"]
     result_generator = generate_process_args(
         process_function=test_func,
         process_args=process_args,
         process_args_static=static_args,
     )
-    results = list(result_generator)
+    first = next(result_generator)
 
     # Check that static args are appended
-    assert len(results[0]) == expected_static_elements, (
-        f"Expected {expected_static_elements} elements, got {len(results[0])}"
+    assert len(first) == expected_static_elements, (
+        f"Expected {expected_static_elements} elements, got {len(first)}"
     )  # func, order, arg, static1, static2
-    assert results[0][3] == expected_static_int, (
-        f"Expected static arg {expected_static_int}, got {results[0][3]}"
-    )
-    assert results[0][4] == "static", (
-        f"Expected static arg 'static', got {results[0][4]}"
+    assert first[3] == expected_static_int, (
+        f"Expected static arg {expected_static_int}, got {first[3]}"
     )
+    assert first[4] == "static", f"Expected static arg 'static', got {first[4]}"
 
     # Test with deepcopy static arguments
     mutable_list = [1, 2, 3]
-    process_args = [[1], [2]]
+    process_args = [(1,), (2,)]
     result_generator = generate_process_args(
         process_function=test_func,
         process_args=process_args,
         deepcopy_static_args=[mutable_list],
     )
-    results = list(result_generator)
 
     # Check that deepcopy args are present and different objects
-    first_deepcopy_arg = results[0][3]
-    second_deepcopy_arg = results[1][3]
+    first_deepcopy_arg = next(result_generator)[3]
+    second_deepcopy_arg = next(result_generator)[3]
 
     assert first_deepcopy_arg == mutable_list, (
         f"Expected {mutable_list}, got {first_deepcopy_arg}"
@@ -155,9 +268,28 @@ def test_generate_process_args() -> None:
     assert first_deepcopy_arg is not second_deepcopy_arg, (
         "Expected different deepcopy objects"
     )
+    first_deepcopy_arg.append(4)
+    assert second_deepcopy_arg == mutable_list, (
+        "Expected deepcopy objects to be independent"
+    )
+
+    # Test with deepcopy static arguments that can't be pickled
+    unpicklable_args = [[lambda: None]]
+    result_generator = generate_process_args(
+        process_function=test_func,
+        process_args=process_args,
+        deepcopy_static_args=unpicklable_args,
+    )
+    first_unpicklable_arg = next(result_generator)[3]
+    assert first_unpicklable_arg is not unpicklable_args[0], (
+        "Expected deepcopy fallback to create different object"
+    )
+    assert first_unpicklable_arg[0] is unpicklable_args[0][0], (
+        "Expected deepcopy fallback to keep the function itself"
+    )
 
     # Test with both static and deepcopy arguments
-    process_args = [[1]]
+    process_args = [(1,)]
     static_args = ["static"]
     deepcopy_args = [{"key": "value"}]
     result_generator = generate_process_args(
@@ -166,19 +298,46 @@ def test_generate_process_args() -> None:
         process_args_static=static_args,
         deepcopy_static_args=deepcopy_args,
     )
-    results = list(result_generator)
+    first = next(result_generator)
 
     expected_length = 5  # func, order, arg, static, deepcopy
-    assert len(results[0]) == expected_length, (
-        f"Expected {expected_length} elements, got {len(results[0])}"
+    assert len(first) == expected_length, (
+        f"Expected {expected_length} elements, got {len(first)}"
+    )
+    assert first[3] == "static", f"Expected 'static', got {first[3]}"
+    assert first[4] == {"key": "value"}, f"Expected dict, got {first[4]}"
+
+
+@pytest.mark.parametrize("arg_class", [PickleRaises, UnpickleRaises])
+def test_generate_process_args_falls_back_on_any_pickle_error(
+    arg_class: type,
+) -> None:
+    """Test generate_process_args deep copies when pickling raises any error."""
+    arg = arg_class()
+    result_generator = generate_process_args(
+        process_function=square,
+        process_args=[(1,), (2,)],
+        deepcopy_static_args=[arg],
+    )
+    first_copy = next(result_generator)[3]
+    second_copy = next(result_generator)[3]
+    assert isinstance(first_copy, arg_class), (
+        f"Expected a {arg_class.__name__} copy, got {first_copy}"
     )
-    assert results[0][3] == "static", f"Expected 'static', got {results[0][3]}"
-    assert results[0][4] == {"key": "value"}, f"Expected dict, got {results[0][4]}"
+    assert first_copy is not arg, "Expected deepcopy fallback to create new object"
+    assert first_copy is not second_copy, "Expected different deepcopy objects"
 
 
-def test_get_multiprocess_results_with_tqdm() -> None:
+def test_get_multiprocess_results_with_tqdm(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test func for get_multiprocess_results_with_tqdm."""
 
+    # results are placed by their order, so sorting is never needed
+    def fail_sorted(*_args: object, **_kwargs: object) -> NoReturn:
+        msg = "sorted must not be called"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(builtins, "sorted", fail_sorted)
+
     # Test basic functionality with ordered results
     def dummy_func() -> None:
         pass
@@ -196,15 +355,10 @@ def test_get_multiprocess_results_with_tqdm() -> None:
 
     # Results should be sorted by order
     expected_results = ["first", "second", "third"]
-    assert len(sorted_results) == expected_count, (
-        f"Expected {expected_count} results, got {len(sorted_results)}"
+    assert sorted_results == expected_results, (
+        f"Expected {expected_results!r}, got {sorted_results!r}"
     )
 
-    for i, (result, expected) in enumerate(
-        zip(sorted_results, expected_results, strict=False),
-    ):
-        assert result == expected, f"At index {i}: expected {expected}, got {result}"
-
     # Test with threading=False (multiprocessing) - using different data types
     int_results = [(1, 100), (0, 50), (2, 150)]
     int_sorted_results = get_multiprocess_results_with_tqdm(
@@ -215,12 +369,9 @@ def test_get_multiprocess_results_with_tqdm() -> None:
     )
 
     expected_int_results = [50, 100, 150]
-    for i, (result_2, expected_2) in enumerate(
-        zip(int_sorted_results, expected_int_results, strict=False),
-    ):
-        assert result_2 == expected_2, (
-            f"At index {i}: expected {expected_2}, got {result_2}"
-        )
+    assert int_sorted_results == expected_int_results, (
+        f"Expected {expected_int_results!r}, got {int_sorted_results!r}"
+    )
 
     # Test with single result
     single_results = [(0, "only")]
@@ -246,6 +397,19 @@ def test_get_multiprocess_results_with_tqdm() -> None:
     assert len(sorted_empty) == 0, f"Expected 0 results, got {len(sorted_empty)}"
     assert sorted_empty == [], f"Expected empty list, got {sorted_empty}"
 
+    # Test with a wrong length hint
+    for process_args_len in (1, 10):
+        hinted_results = get_multiprocess_results_with_tqdm(
+            results=results,
+            process_func=dummy_func,
+            process_args_len=process_args_len,
+            threads=True,
+        )
+        assert hinted_results == expected_results, (
+            f"Expected {expected_results} with length hint {process_args_len}, "
+            f"got {hinted_results}"
+        )
+
 
 def test_find_max_pools() -> None:
     """Test func for find_max_pools."""
@@ -258,7 +422,7 @@ def test_find_max_pools() -> None:
     )
 
     # Should be reasonable based on CPU count
-    cpu_count = os.cpu_count() or 1
+    cpu_count = _CPU_COUNT
     max_expected_threads = cpu_count * 4
     assert threading_pools <= max_expected_threads, (
         f"Expected at most {max_expected_threads} thread pools, got {threading_pools}"
@@ -287,95 +451,68 @@ def test_find_max_pools() -> None:
     assert large_task_pools >= 1, f"Expected at least 1 pool, got {large_task_pools}"
 
 
-def test_concurrent_loop() -> None:
+@pytest.mark.parametrize(("loop_kwargs", "expected"), LOOP_CASES)
+def test_concurrent_loop(
+    loop_kwargs: dict[str, Any],
+    expected: list[Any],
+) -> None:
     """Test func for concurrent_loop."""
+    results = concurrent_loop(threading=True, **loop_kwargs)
+    assert results == expected, f"Expected {expected}, got {results}"
 
-    # Test basic threading functionality
-    def square_func(x: int) -> int:
-        return x * x
 
-    process_args = [[1], [2], [3], [4]]
+@pytest.mark.parametrize("threading", [True, False], ids=["threads", "processes"])
+@pytest.mark.parametrize(
+    ("process_args", "expected"),
+    [pytest.param([(42,)], [1764], id="single_item"), pytest.param([], [], id="empty")],
+)
+def test_concurrent_loop_without_pool(
+    mocker: MockerFixture,
+    *,
+    threading: bool,
+    process_args: list[tuple[Any, ...]],
+    expected: list[Any],
+) -> None:
+    """Test that concurrent_loop runs a single or no task without a pool."""
+    no_pool = AssertionError("Expected no pool to be created")
+    mocker.patch.object(concurrent, "ThreadPoolExecutor", side_effect=no_pool)
+    mocker.patch.object(multiprocessing, "get_spawn_pool", side_effect=no_pool)
     results = concurrent_loop(
-        threading=True,
-        process_function=square_func,
+        threading=threading,
+        process_function=square,
         process_args=process_args,
     )
+    assert results == expected, f"Expected {expected}, got {results}"
 
-    expected_results = [1, 4, 9, 16]
-    expected_count = 4
-    assert len(results) == expected_count, (
-        f"Expected {expected_count} results, got {len(results)}"
-    )
-
-    for i, (result, expected) in enumerate(
-        zip(results, expected_results, strict=False),
-    ):
-        assert result == expected, f"At index {i}: expected {expected}, got {result}"
 
-    # Test with static arguments
-    def add_func(x: int, y: int) -> int:
-        return x + y
-
-    process_args = [[1], [2], [3]]
-    static_args = [10]
+def test_concurrent_loop_with_executor(thread_pool: ThreadPoolExecutor) -> None:
+    """Test concurrent_loop with an injected executor."""
     results = concurrent_loop(
         threading=True,
-        process_function=add_func,
-        process_args=process_args,
-        process_args_static=static_args,
+        process_function=square,
+        process_args=[(1,), (2,), (3,)],
+        executor=thread_pool,
     )
+    expected = [1, 4, 9]
+    assert results == expected, f"Expected {expected}, got {results}"
 
-    expected_results = [11, 12, 13]
-    for i, (result, expected) in enumerate(
-        zip(results, expected_results, strict=False),
-    ):
-        assert result == expected, f"At index {i}: expected {expected}, got {result}"
-
-    # Test with process_args_len parameter
-    def identity_func(x: str) -> str:
-        return x
-
-    string_process_args = [["test1"], ["test2"]]
-    string_results = concurrent_loop(
-        threading=True,
-        process_function=identity_func,
-        process_args=string_process_args,
-        process_args_len=2,
+    # the injected executor must stay usable afterwards
+    expected_square_of_2 = 4
+    assert thread_pool.submit(square, 2).result() == expected_square_of_2, (
+        "Expected the injected executor not to be shut down"
     )
 
-    expected_string_results = ["test1", "test2"]
-    for idx, (result_2, expected_2) in enumerate(
-        zip(string_results, expected_string_results, strict=False),
+    # executor is keyword-only in all public loop signatures
+    for loop in (
+        concurrent_loop,
+        multiprocessing.multiprocess_loop,
+        multithreading.multithread_loop,
     ):
-        assert result_2 == expected_2, (
-            f"At index {idx}: expected {expected_2}, got {result_2}"
+        kind = inspect.signature(loop).parameters["executor"].kind
+        assert kind is inspect.Parameter.KEYWORD_ONLY, (
+            f"Expected executor to be keyword-only in {loop.__name__}, got {kind}"
         )
 
-    # Test edge case with single item
-    single_process_args = [[42]]
-    single_results = concurrent_loop(
-        threading=True,
-        process_function=square_func,
-        process_args=single_process_args,
-    )
-
-    expected_single_result = 1764
-    assert len(single_results) == 1, f"Expected 1 result, got {len(single_results)}"
-    assert single_results[0] == expected_single_result, (
-        f"Expected {expected_single_result}, got {single_results[0]}"
-    )
-
-    # Test edge case with empty args
-    empty_process_args: list[list[Any]] = []
-    empty_results = concurrent_loop(
-        threading=True,
-        process_function=square_func,
-        process_args=empty_process_args,
-    )
-
-    assert len(empty_results) == 0, f"Expected 0 results, got {len(empty_results)}"
-    assert empty_results == [], f"Expected empty list, got {empty_results}"
-
 
 # Note: test_get_order_and_func_result_func() is not needed as
 # get_order_and_func_result_func was removed from the current implementation
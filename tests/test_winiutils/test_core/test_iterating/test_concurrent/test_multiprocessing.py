@@ -1,222 +1,162 @@
 """Tests for the multiprocessing module."""
 
 import multiprocessing
-import time
+from multiprocessing.pool import Pool
 from typing import Any
 
 import pytest
+from pytest_mock import MockerFixture
 
 from winiutils.core.iterating.concurrent.multiprocessing import (
+    _spawn_ctx,
     cancel_on_timeout,
     get_spawn_pool,
     multiprocess_loop,
 )
 
-
-# Module-level functions for multiprocessing tests (must be pickle-able)
-def quick_function(x: int, y: int = 10) -> int:
-    """Quick function for testing timeout functionality."""
-    return x + y
-
-
-def slow_function() -> str:
-    """Slow function for testing timeout behavior."""
-    time.sleep(2.0)  # Sleep longer than timeout
-    return "completed"
-
-
-def function_with_args(name: str, count: int, multiplier: float = 1.0) -> str:
-    """Function with various argument types for testing."""
-    return f"{name}_{count * multiplier}"
-
-
-def instant_function() -> str:
-    """Instant function for testing zero timeout."""
-    return "instant"
-
-
-def square_function(x: int) -> int:
-    """Square function for testing basic parallel execution."""
-    return x * x
-
-
-def add_function(x: int, y: int) -> int:
-    """Add function for testing static arguments."""
-    return x + y
-
-
-def multiply_function(x: int, y: int, z: int) -> int:
-    """Multiply function for testing multiple arguments."""
-    return x * y * z
-
-
-def append_to_list(item: str, target_list: list[str]) -> list[str]:
-    """Append function for testing deepcopy arguments."""
-    target_list.append(item)
-    return target_list.copy()
-
-
-def simple_identity(x: str) -> str:
-    """Identity function for testing process_args_len."""
-    return x
+from . import _mp_workers as mp_workers
+
+LOOP_CASES = [
+    pytest.param(
+        {
+            "process_function": mp_workers.square_function,
+            "process_args": [(1,), (2,), (3,), (4,), (5,)],
+            "process_args_len": 5,
+        },
+        [1, 4, 9, 16, 25],
+        id="basic",
+    ),
+    pytest.param(
+        {
+            "process_function": mp_workers.add_function,
+            "process_args": [(1,), (2,), (3,)],
+            "process_args_len": 3,
+            "process_args_static": [10],
+        },
+        [11, 12, 13],
+        id="static_args",
+    ),
+    pytest.param(
+        {
+            "process_function": mp_workers.multiply_function,
+            "process_args": [(1, 2, 3), (2, 3, 4), (3, 4, 5)],
+            "process_args_len": 3,
+        },
+        [6, 24, 60],
+        id="multiple_args",
+    ),
+    pytest.param(
+        {
+            "process_function": mp_workers.simple_identity,
+            "process_args": [("test1",), ("test2",)],
+            "process_args_len": 2,
+        },
+        ["test1", "test2"],
+        id="process_args_len",
+    ),
+    pytest.param(
+        {
+            "process_function": mp_workers.append_to_list,
+            "process_args": [("a",), ("b",), ("c",)],
+            "process_args_len": 3,
+            # the empty list must be deep copied for each process
+            "deepcopy_static_args": [[]],
+        },
+        [["a"], ["b"], ["c"]],
+        id="deepcopy_static_args",
+    ),
+    pytest.param(
+        {
+            "process_function": mp_workers.square_function,
+            "process_args": [(42,)],
+            "process_args_len": 1,
+        },
+        [1764],
+        id="single_item",
+    ),
+    pytest.param(
+        {
+            "process_function": mp_workers.square_function,
+            "process_args": [],
+            "process_args_len": 0,
+        },
+        [],
+        id="empty",
+    ),
+]
 
 
-def test_get_spawn_pool() -> None:
+def test_get_spawn_pool(mocker: MockerFixture) -> None:
     """Test func for get_spawn_pool."""
-    with get_spawn_pool(processes=1) as pool:
-        ctx = getattr(pool, "_ctx", None)
-        method = getattr(ctx, "get_start_method", lambda: None)()
-        assert method == "spawn", "Expected spawn context"
+    assert _spawn_ctx.get_start_method() == "spawn", "Expected spawn context"
+    # no real pool is started, the spawn_pool fixture covers that
+    mock_pool = mocker.patch.object(_spawn_ctx, "Pool")
+    pool = get_spawn_pool(processes=1)
+    mock_pool.assert_called_once_with(processes=1)
+    assert pool is mock_pool.return_value, "Expected a pool of the spawn context"
 
 
-def test_cancel_on_timeout() -> None:
+def test_cancel_on_timeout(mocker: MockerFixture) -> None:
     """Test func for cancel_on_timeout."""
     expected_sum = 20
     expected_result = "test_10.0"
 
     # Test successful execution within timeout
     wrapped_func = cancel_on_timeout(seconds=5.0, message="Test timeout")(
-        quick_function,
+        mp_workers.quick_function,
     )
     result = wrapped_func(5, y=15)
     assert result == expected_sum, f"Expected {expected_sum}, got {result}"
 
-    # Test timeout behavior
-    wrapped_slow_func = cancel_on_timeout(seconds=0.5, message="Slow function timeout")(
-        slow_function,
-    )
-
-    with pytest.raises(multiprocessing.TimeoutError):
-        wrapped_slow_func()
-
     # Test with different argument types
     wrapped_args_func = cancel_on_timeout(seconds=3.0, message="Args test timeout")(
-        function_with_args,
+        mp_workers.function_with_args,
     )
     result = wrapped_args_func("test", 5, multiplier=2.0)
     assert result == expected_result, f"Expected '{expected_result}', got {result}"
 
     # Test edge case with zero timeout (should timeout immediately)
     wrapped_instant = cancel_on_timeout(seconds=0.0, message="Zero timeout")(
-        instant_function,
+        mp_workers.instant_function,
     )
 
     with pytest.raises(multiprocessing.TimeoutError):
         wrapped_instant()
 
-
-def test_multiprocess_loop() -> None:
-    """Test func for multiprocess_loop."""
-    # Test basic parallel execution
-    process_args = [[1], [2], [3], [4], [5]]
-    results = multiprocess_loop(
-        process_function=square_function,
-        process_args=process_args,
-    )
-    expected_results = [1, 4, 9, 16, 25]
-    assert len(results) == len(expected_results), (
-        f"Expected {len(expected_results)} results, got {len(results)}"
-    )
-
-    # Results should be in original order
-    for i, (result, expected) in enumerate(
-        zip(results, expected_results, strict=False),
-    ):
-        assert result == expected, f"At index {i}: expected {expected}, got {result}"
-
-    # Test with static arguments
-    process_args = [[1], [2], [3]]
-    static_args = [10]  # Add 10 to each number
-    results = multiprocess_loop(
-        process_function=add_function,
-        process_args=process_args,
-        process_args_static=static_args,
-    )
-    expected_results = [11, 12, 13]
-    assert len(results) == len(expected_results), (
-        f"Expected {len(expected_results)} results, got {len(results)}"
+    # Test timeout behavior without waiting on the clock, the pool's result
+    # times out right away and the worker must still be torn down
+    mock_pool = mocker.patch.object(_spawn_ctx, "Pool").return_value
+    pool = mock_pool.__enter__.return_value
+    pool.apply_async.return_value.get.side_effect = multiprocessing.TimeoutError
+    wrapped_slow_func = cancel_on_timeout(
+        seconds=0.05,
+        message="Slow function timeout",
+    )(
+        mp_workers.slow_function,
     )
 
-    for i, (result, expected) in enumerate(
-        zip(results, expected_results, strict=False),
-    ):
-        assert result == expected, f"At index {i}: expected {expected}, got {result}"
-
-    # Test with multiple arguments per function call
-    process_args = [[1, 2, 3], [2, 3, 4], [3, 4, 5]]
-    results = multiprocess_loop(
-        process_function=multiply_function,
-        process_args=process_args,
-    )
-    expected_results = [6, 24, 60]  # 1*2*3, 2*3*4, 3*4*5
-    assert len(results) == len(expected_results), (
-        f"Expected {len(expected_results)} results, got {len(results)}"
-    )
-
-    for i, (result, expected) in enumerate(
-        zip(results, expected_results, strict=False),
-    ):
-        assert result == expected, f"At index {i}: expected {expected}, got {result}"
-
-    # Test edge case with single item
-    single_process_args = [[42]]
-    results = multiprocess_loop(
-        process_function=square_function,
-        process_args=single_process_args,
-    )
-    assert len(results) == 1, f"Expected 1 result, got {len(results)}"
-    expected_square_of_42 = 1764
-    assert results[0] == expected_square_of_42, (
-        f"Expected {expected_square_of_42} (42^2), got {results[0]}"
-    )
-
-    # Test edge case with empty args (should return empty list)
-    empty_process_args: list[list[Any]] = []
-    results = multiprocess_loop(
-        process_function=square_function,
-        process_args=empty_process_args,
-    )
-    assert results == [], f"Expected empty list, got {results}"
-
-
-def test_multiprocess_loop_with_deepcopy_args() -> None:
-    """Test multiprocess_loop with deepcopy static arguments."""
-    # Test with deepcopy static arguments
-    process_args = [["a"], ["b"], ["c"]]
-    deepcopy_args: list[list[str]] = [
-        [],
-    ]  # Empty list that should be deep copied for each process
-    results = multiprocess_loop(
-        process_function=append_to_list,
-        process_args=process_args,
-        deepcopy_static_args=deepcopy_args,
-    )
-    expected_results: list[list[str]] = [["a"], ["b"], ["c"]]
-    assert len(results) == len(expected_results), (
-        f"Expected {len(expected_results)} results, got {len(results)}"
-    )
-
-    for i, (result, expected) in enumerate(
-        zip(results, expected_results, strict=False),
-    ):
-        assert result == expected, f"At index {i}: expected {expected}, got {result}"
-
+    with pytest.raises(multiprocessing.TimeoutError):
+        wrapped_slow_func()
+    pool.apply_async.assert_called_once_with(mp_workers.slow_function, (), {})
+    pool.apply_async.return_value.get.assert_called_once_with(timeout=0.05)
+    pool.terminate.assert_called_once_with()
+    pool.join.assert_called_once_with()
+
+
+@pytest.mark.parametrize(("loop_kwargs", "expected"), LOOP_CASES)
+def test_multiprocess_loop(
+    spawn_pool: Pool,
+    mocker: MockerFixture,
+    loop_kwargs: dict[str, Any],
+    expected: list[Any],
+) -> None:
+    """Test func for multiprocess_loop."""
+    imap_unordered = mocker.spy(spawn_pool, "imap_unordered")
+    results = multiprocess_loop(**loop_kwargs, executor=spawn_pool)
+    assert results == expected, f"Expected {expected}, got {results}"
 
-def test_multiprocess_loop_with_process_args_len() -> None:
-    """Test multiprocess_loop with process_args_len parameter."""
-    # Test with process_args_len parameter
-    process_args = [["test1"], ["test2"]]
-    results = multiprocess_loop(
-        process_function=simple_identity,
-        process_args=process_args,
-        process_args_len=2,
-    )
-    expected_results: list[str] = ["test1", "test2"]
-    assert len(results) == len(expected_results), (
-        f"Expected {len(expected_results)} results, got {len(results)}"
+    # several tasks must run on the shared pool, a single one runs inline
+    uses_pool = loop_kwargs["process_args_len"] > 1
+    assert imap_unordered.called == uses_pool, (
+        f"Expected the pool to be used: {uses_pool}"
     )
-
-    for i, (result, expected) in enumerate(
-        zip(results, expected_results, strict=False),
-    ):
-        assert result == expected, f"At index {i}: expected {expected}, got {result}"
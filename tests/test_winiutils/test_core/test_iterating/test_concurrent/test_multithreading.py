@@ -3,10 +3,13 @@
 This module tests the functionality of the multithreading utilities.
 """
 
-import time
+import threading
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import pytest
+from pytest_mock import MockerFixture
+
 from winiutils.core.iterating.concurrent.multithreading import (
     get_future_results_as_completed,
     imap_unordered,
@@ -14,7 +17,86 @@ from winiutils.core.iterating.concurrent.multithreading import (
 )
 
 
-def test_get_future_results_as_completed() -> None:
+def square(x: int) -> int:
+    """Square a number."""
+    return x * x
+
+
+def add(x: int, y: int) -> int:
+    """Add two numbers."""
+    return x + y
+
+
+def multiply(x: int, y: int, z: int) -> int:
+    """Multiply three numbers."""
+    return x * y * z
+
+
+def identity(x: str) -> str:
+    """Return the input unchanged."""
+    return x
+
+
+LOOP_CASES = [
+    pytest.param(
+        {
+            "process_function": square,
+            "process_args": [(1,), (2,), (3,), (4,), (5,)],
+            "process_args_len": 5,
+        },
+        [1, 4, 9, 16, 25],
+        id="basic",
+    ),
+    pytest.param(
+        {
+            "process_function": add,
+            "process_args": [(1,), (2,), (3,)],
+            "process_args_len": 3,
+            "process_args_static": [10],
+        },
+        [11, 12, 13],
+        id="static_args",
+    ),
+    pytest.param(
+        {
+            "process_function": multiply,
+            "process_args": [(1, 2, 3), (2, 3, 4), (3, 4, 5)],
+            "process_args_len": 3,
+        },
+        [6, 24, 60],
+        id="multiple_args",
+    ),
+    pytest.param(
+        {
+            "process_function": identity,
+            "process_args": [("test1",), ("test2",)],
+            "process_args_len": 2,
+        },
+        ["test1", "test2"],
+        id="process_args_len",
+    ),
+    pytest.param(
+        {
+            "process_function": square,
+            "process_args": [(42,)],
+            "process_args_len": 1,
+        },
+        [1764],
+        id="single_item",
+    ),
+    pytest.param(
+        {
+            "process_function": square,
+            "process_args": [],
+            "process_args_len": 0,
+        },
+        [],
+        id="empty",
+    ),
+]
+
+
+def test_get_future_results_as_completed(thread_pool: ThreadPoolExecutor) -> None:
     """Test func for get_future_results_as_completed."""
     expected_futures_count = 3
     expected_single_result = 10
@@ -23,238 +105,148 @@ def test_get_future_results_as_completed() -> None:
     def simple_task(value: int) -> int:
         return value * 2
 
-    def slow_task(value: int) -> int:
-        time.sleep(0.1)  # Small delay to test completion order
-        return value * 3
-
-    # Create futures manually
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        futures = [
-            executor.submit(simple_task, 1),
-            executor.submit(slow_task, 2),
-            executor.submit(simple_task, 3),
-        ]
-
-        # Get results as they complete
-        results = list(get_future_results_as_completed(futures))
-
-        # Should have all results
-        assert len(results) == expected_futures_count, (
-            f"Expected {expected_futures_count} results, got {len(results)}"
-        )
-
-        # Results should contain expected values
-        # (order may vary due to completion timing)
-        # 1*2=2, 2*3=6, 3*2=6, so set should be {2, 6}
-        expected_values = {2, 6}
-        result_set = set(results)
-        assert result_set == expected_values, (
-            f"Expected {expected_values}, got {result_set}"
-        )
-
-    # Test with empty futures list
-    empty_results = list(get_future_results_as_completed([]))
-    assert len(empty_results) == 0, f"Expected 0 results, got {len(empty_results)}"
-
-    # Test with single future
-    with ThreadPoolExecutor(max_workers=1) as executor:
-        single_future = [executor.submit(simple_task, 5)]
-        single_results = list(get_future_results_as_completed(single_future))
-        assert len(single_results) == 1, f"Expected 1 result, got {len(single_results)}"
-        assert single_results[0] == expected_single_result, (
-            f"Expected {expected_single_result}, got {single_results[0]}"
-        )
-
+    # both synced tasks must run at the same time to pass the barrier
+    barrier = threading.Barrier(2)
 
-def test_multithread_loop() -> None:
-    """Test func for multithread_loop."""
-
-    # Test basic parallel execution
-    def square_function(x: int) -> int:
-        return x * x
+    def synced_task(value: int, factor: int) -> int:
+        barrier.wait(timeout=2)
+        return value * factor
 
-    process_args = [[1], [2], [3], [4], [5]]
-    results = multithread_loop(
-        process_function=square_function,
-        process_args=process_args,
-    )
-    expected_results = [1, 4, 9, 16, 25]
-    assert len(results) == len(expected_results), (
-        f"Expected {len(expected_results)} results, got {len(results)}"
+    # Create futures manually
+    futures = [
+        thread_pool.submit(simple_task, 1),
+        thread_pool.submit(synced_task, 2, 3),
+        thread_pool.submit(synced_task, 3, 2),
+    ]
+
+    # Get results as they complete
+    results = list(get_future_results_as_completed(futures))
+
+    # Should have all results
+    assert len(results) == expected_futures_count, (
+        f"Expected {expected_futures_count} results, got {len(results)}"
     )
 
-    # Results should be in original order
-    for i, (result, expected) in enumerate(
-        zip(results, expected_results, strict=False),
-    ):
-        assert result == expected, f"At index {i}: expected {expected}, got {result}"
-
-    # Test with static arguments
-    def add_function(x: int, y: int) -> int:
-        return x + y
-
-    process_args = [[1], [2], [3]]
-    static_args = [10]  # Add 10 to each number
-    results = multithread_loop(
-        process_function=add_function,
-        process_args=process_args,
-        process_args_static=static_args,
-    )
-    expected_results = [11, 12, 13]
-    assert len(results) == len(expected_results), (
-        f"Expected {len(expected_results)} results, got {len(results)}"
+    # Results should contain expected values
+    # (order may vary due to completion timing)
+    # 1*2=2, 2*3=6, 3*2=6, so set should be {2, 6}
+    expected_values = {2, 6}
+    result_set = set(results)
+    assert result_set == expected_values, (
+        f"Expected {expected_values}, got {result_set}"
     )
 
-    for i, (result, expected) in enumerate(
-        zip(results, expected_results, strict=False),
-    ):
-        assert result == expected, f"At index {i}: expected {expected}, got {result}"
-
-    # Test with multiple arguments per function call
-    def multiply_function(x: int, y: int, z: int) -> int:
-        return x * y * z
+    # Test with empty futures list
+    empty_results = list(get_future_results_as_completed([]))
+    assert len(empty_results) == 0, f"Expected 0 results, got {len(empty_results)}"
 
-    process_args = [[1, 2, 3], [2, 3, 4], [3, 4, 5]]
-    results = multithread_loop(
-        process_function=multiply_function,
-        process_args=process_args,
-    )
-    expected_results = [6, 24, 60]  # 1*2*3, 2*3*4, 3*4*5
-    assert len(results) == len(expected_results), (
-        f"Expected {len(expected_results)} results, got {len(results)}"
+    # Test with many futures, which must not cost quadratic time
+    many_count = 5000
+    many_futures = [thread_pool.submit(simple_task, i) for i in range(many_count)]
+    many_results = sorted(get_future_results_as_completed(many_futures))
+    expected_many = [i * 2 for i in range(many_count)]
+    assert many_results == expected_many, (
+        f"Expected {expected_many!r}, got {many_results!r}"
     )
 
-    for i, (result, expected) in enumerate(
-        zip(results, expected_results, strict=False),
-    ):
-        assert result == expected, f"At index {i}: expected {expected}, got {result}"
-
-    # Test with process_args_len parameter
-    def simple_identity(x: str) -> str:
-        return x
-
-    string_process_args = [["test1"], ["test2"]]
-    string_results = multithread_loop(
-        process_function=simple_identity,
-        process_args=string_process_args,
-        process_args_len=2,
-    )
-    expected_string_results = ["test1", "test2"]
-    assert len(string_results) == len(expected_string_results), (
-        f"Expected {len(expected_string_results)} results, got {len(string_results)}"
+    # Test with single future
+    single_future = [thread_pool.submit(simple_task, 5)]
+    single_results = list(get_future_results_as_completed(single_future))
+    assert len(single_results) == 1, f"Expected 1 result, got {len(single_results)}"
+    assert single_results[0] == expected_single_result, (
+        f"Expected {expected_single_result}, got {single_results[0]}"
     )
 
-    for i, (result_2, expected_2) in enumerate(
-        zip(string_results, expected_string_results, strict=False),
-    ):
-        assert result_2 == expected_2, (
-            f"At index {i}: expected {expected_2}, got {result_2}"
-        )
-
-    # Test edge case with single item
-    expected_square_of_42 = 1764
-    single_process_args = [[42]]
-    results = multithread_loop(
-        process_function=square_function,
-        process_args=single_process_args,
-    )
-    assert len(results) == 1, f"Expected 1 result, got {len(results)}"
-    assert results[0] == expected_square_of_42, (
-        f"Expected {expected_square_of_42} (42^2), got {results[0]}"
-    )
 
-    # Test edge case with empty args (should return empty list)
-    empty_process_args: list[list[Any]] = []
-    results = multithread_loop(
-        process_function=square_function,
-        process_args=empty_process_args,
+@pytest.mark.parametrize(("loop_kwargs", "expected"), LOOP_CASES)
+def test_multithread_loop(
+    thread_pool: ThreadPoolExecutor,
+    mocker: MockerFixture,
+    loop_kwargs: dict[str, Any],
+    expected: list[Any],
+) -> None:
+    """Test func for multithread_loop."""
+    submit = mocker.spy(thread_pool, "submit")
+    results = multithread_loop(**loop_kwargs, executor=thread_pool)
+    assert results == expected, f"Expected {expected}, got {results}"
+
+    # several tasks must run on the shared pool, a single one runs inline
+    process_args_len = loop_kwargs["process_args_len"]
+    expected_submits = process_args_len if process_args_len > 1 else 0
+    assert submit.call_count == expected_submits, (
+        f"Expected {expected_submits} submits, got {submit.call_count}"
     )
-    assert len(results) == 0, f"Expected 0 results for empty args, got {len(results)}"
-    assert results == [], f"Expected empty list, got {results}"
 
 
-def test_imap_unordered() -> None:
+def test_imap_unordered(thread_pool: ThreadPoolExecutor) -> None:
     """Test func for imap_unordered."""
     expected_int_count = 5
     expected_string_count = 3
     expected_single_double = 14
-    max_parallel_time = 1
     expected_parallel_count = 3
 
     # Test basic functionality
     def double_function(x: int) -> int:
         return x * 2
 
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        iterable = [1, 2, 3, 4, 5]
-        results = list(imap_unordered(executor, double_function, iterable))
+    iterable = [1, 2, 3, 4, 5]
+    results = list(imap_unordered(thread_pool, double_function, iterable))
 
-        # Should have all results
-        assert len(results) == expected_int_count, (
-            f"Expected {expected_int_count} results, got {len(results)}"
-        )
+    # Should have all results
+    assert len(results) == expected_int_count, (
+        f"Expected {expected_int_count} results, got {len(results)}"
+    )
 
-        # Results should contain expected values (order may vary)
-        expected_values = {2, 4, 6, 8, 10}  # 1*2, 2*2, 3*2, 4*2, 5*2
-        result_set = set(results)
-        assert result_set == expected_values, (
-            f"Expected {expected_values}, got {result_set}"
-        )
+    # Results should contain expected values (order may vary)
+    expected_values = {2, 4, 6, 8, 10}  # 1*2, 2*2, 3*2, 4*2, 5*2
+    result_set = set(results)
+    assert result_set == expected_values, (
+        f"Expected {expected_values}, got {result_set}"
+    )
 
     # Test with string processing
     def uppercase_function(s: str) -> str:
         return s.upper()
 
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        string_iterable = ["hello", "world", "test"]
-        string_results = list(
-            imap_unordered(executor, uppercase_function, string_iterable),
-        )
-
-        assert len(string_results) == expected_string_count, (
-            f"Expected {expected_string_count} results, got {len(string_results)}"
-        )
-        expected_string_values = {"HELLO", "WORLD", "TEST"}
-        string_result_set = set(string_results)
-        assert string_result_set == expected_string_values, (
-            f"Expected {expected_string_values}, got {string_result_set}"
-        )
+    string_iterable = ["hello", "world", "test"]
+    string_results = list(
+        imap_unordered(thread_pool, uppercase_function, string_iterable),
+    )
+
+    assert len(string_results) == expected_string_count, (
+        f"Expected {expected_string_count} results, got {len(string_results)}"
+    )
+    expected_string_values = {"HELLO", "WORLD", "TEST"}
+    string_result_set = set(string_results)
+    assert string_result_set == expected_string_values, (
+        f"Expected {expected_string_values}, got {string_result_set}"
+    )
 
     # Test with empty iterable
-    with ThreadPoolExecutor(max_workers=1) as executor:
-        empty_results = list(imap_unordered(executor, double_function, []))
-        assert len(empty_results) == 0, f"Expected 0 results, got {len(empty_results)}"
+    empty_results = list(imap_unordered(thread_pool, double_function, []))
+    assert len(empty_results) == 0, f"Expected 0 results, got {len(empty_results)}"
 
     # Test with single item
-    with ThreadPoolExecutor(max_workers=1) as executor:
-        single_results = list(imap_unordered(executor, double_function, [7]))
-        assert len(single_results) == 1, f"Expected 1 result, got {len(single_results)}"
-        assert single_results[0] == expected_single_double, (
-            f"Expected {expected_single_double}, got {single_results[0]}"
-        )
-
-    # Test with function that takes time (to verify parallel execution)
-    def slow_function(x: int) -> int:
-        time.sleep(0.05)  # Small delay
+    single_results = list(imap_unordered(thread_pool, double_function, [7]))
+    assert len(single_results) == 1, f"Expected 1 result, got {len(single_results)}"
+    assert single_results[0] == expected_single_double, (
+        f"Expected {expected_single_double}, got {single_results[0]}"
+    )
+
+    # Test parallel execution, serial execution would break the barrier
+    barrier = threading.Barrier(expected_parallel_count)
+
+    def synced_function(x: int) -> int:
+        barrier.wait(timeout=2)
         return x * 3
 
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        start_time = time.time()
-        parallel_results = list(imap_unordered(executor, slow_function, [1, 2, 3]))
-        end_time = time.time()
-
-        # Should complete faster than sequential execution
-        # Sequential would take ~0.15s, parallel should be much faster
-        execution_time = end_time - start_time
-        assert execution_time < max_parallel_time, (
-            f"Parallel execution took too long: {execution_time:.3f}s"
-        )  # Allow some margin for overhead
-
-        assert len(parallel_results) == expected_parallel_count, (
-            f"Expected {expected_parallel_count} results, got {len(parallel_results)}"
-        )
-        expected_parallel_values = {3, 6, 9}  # 1*3, 2*3, 3*3
-        parallel_result_set = set(parallel_results)
-        assert parallel_result_set == expected_parallel_values, (
-            f"Expected {expected_parallel_values}, got {parallel_result_set}"
-        )
+    parallel_results = list(imap_unordered(thread_pool, synced_function, [1, 2, 3]))
+
+    assert len(parallel_results) == expected_parallel_count, (
+        f"Expected {expected_parallel_count} results, got {len(parallel_results)}"
+    )
+    expected_parallel_values = {3, 6, 9}  # 1*3, 2*3, 3*3
+    parallel_result_set = set(parallel_results)
+    assert parallel_result_set == expected_parallel_values, (
+        f"Expected {expected_parallel_values}, got {parallel_result_set}"
+    )
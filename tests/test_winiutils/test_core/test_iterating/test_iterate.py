@@ -21,6 +21,20 @@ def test_get_len_with_default() -> None:
         f"Expected 3, got {get_len_with_default(test_set)}"
     )
 
+    # Test with a lazy sized iterable, its length is used over the default
+    test_range = range(5)
+    result = get_len_with_default(test_range, default=1)
+    assert result == len(test_range), f"Expected 5, got {result}"
+
+    # Test with objects that have no usable len() despite a __len__ lookup
+    class Proxy:
+        def __getattr__(self, name: str) -> object:
+            return getattr([1, 2, 3], name)
+
+    for unsized in (list, Proxy()):
+        result = get_len_with_default(unsized, default=0)  # type: ignore[arg-type]
+        assert result == 0, f"Expected the default for {unsized!r}, got {result}"
+
     # Test with generator
     expected_len = 3
     test_gen = (x for x in range(expected_len))
@@ -28,5 +42,5 @@ def test_get_len_with_default() -> None:
     assert result == expected_len, f"Expected 3, got {result}"
 
     # Test with no default raises TypeError
-    with pytest.raises(TypeError):
+    with pytest.raises(TypeError, match="no default value provided"):
         get_len_with_default(test_gen)
@@ -3,12 +3,16 @@
 tests.test_winipedia_utils.test_oop.test_mixins.test_meta
 """
 
+import logging
+import threading
+
 from pytest_mock import MockFixture
 
 from winiutils.core.data.structures.text.string_ import value_to_truncated_string
 from winiutils.core.oop.mixins import meta
 from winiutils.core.oop.mixins.meta import (
     ABCLoggingMeta,
+    no_logging,
 )
 
 
@@ -59,6 +63,34 @@ class TestABCLoggingMeta:
         # Verify wrap_with_logging was NOT called for non-loggable methods
         mock_wrap_logging.assert_not_called()
 
+    def test___new___skips_no_logging_classes(self, mocker: MockFixture) -> None:
+        """Test that __new__ does not wrap classes opted out of logging."""
+        mock_wrap_logging = mocker.patch.object(ABCLoggingMeta, "wrap_with_logging")
+
+        class HotClass(metaclass=ABCLoggingMeta):
+            __no_logging__ = True
+
+            def method(self) -> str:
+                return "hot"
+
+        # subclasses inherit the opt out
+        class HotSubClass(HotClass):
+            def sub_method(self) -> str:
+                return "sub"
+
+        mock_wrap_logging.assert_not_called()
+        assert HotSubClass().sub_method() == "sub", "Expected an unwrapped method"
+
+        # and can turn logging back on
+        class LoggedSubClass(HotClass):
+            __no_logging__ = False
+
+            def sub_method(self) -> str:
+                return "sub"
+
+        mock_wrap_logging.assert_called_once()
+        assert "sub_method" in vars(LoggedSubClass), "Expected the method wrapped"
+
     def test_is_loggable_method(self, mocker: MockFixture) -> None:
         """Test method for is_loggable_method."""
         # Mock is_funclike to control its behavior
@@ -81,14 +113,37 @@ class TestABCLoggingMeta:
         magic_method.__name__ = "__init__"
         mock_is_funclike.return_value = True
 
+        mock_is_funclike.reset_mock()
+
         result = ABCLoggingMeta.is_loggable_method(magic_method)
         assert result is False, "Expected magic method to not be loggable"
+        # the name alone decides, the object is not introspected
+        mock_is_funclike.assert_not_called()
+
+        # Test case 3: Methods opted out with no_logging (should not be loggable)
+        @no_logging
+        def hot_method() -> None:
+            pass
+
+        result = ABCLoggingMeta.is_loggable_method(hot_method)
+        assert result is False, "Expected no_logging method to not be loggable"
+
+        def hot_classmethod() -> None:
+            pass
+
+        # no_logging applied below and above classmethod
+        for method in (
+            classmethod(no_logging(hot_classmethod)),
+            no_logging(classmethod(hot_classmethod)),
+        ):
+            result = ABCLoggingMeta.is_loggable_method(method)
+            assert result is False, "Expected no_logging classmethod to be skipped"
 
     def test_wrap_with_logging(self, mocker: MockFixture) -> None:
         """Test method for wrap_with_logging."""
         # Mock dependencies
         mock_logger = mocker.patch(meta.__name__ + ".logger")
-        mock_time = mocker.patch("time.time")
+        mock_time = mocker.patch("time.monotonic_ns")
         mock_value_to_truncated_string = mocker.patch(
             value_to_truncated_string.__module__
             + "."
@@ -96,7 +151,8 @@ class TestABCLoggingMeta:
         )
 
         # Set up time mock to simulate passage of time
-        mock_time.side_effect = [1000.0, 1000.5, 1001.0]  # start, during, end
+        start_ns = 1_000_000_000_000
+        mock_time.side_effect = [start_ns, start_ns + 500_000_000]  # start, end
         mock_value_to_truncated_string.return_value = "truncated"
 
         # Create a test function to wrap
@@ -132,7 +188,7 @@ class TestABCLoggingMeta:
         )
 
         # Verify call time was recorded
-        assert "test_func" in call_times, (
+        assert call_times["test_func"] == start_ns, (
             "Expected call time to be recorded for test_func"
         )
 
@@ -140,10 +196,17 @@ class TestABCLoggingMeta:
         """Test that wrap_with_logging implements rate limiting."""
         # Mock dependencies
         mock_logger = mocker.patch(meta.__name__ + ".logger")
-        mock_time = mocker.patch("time.time")
+        mock_time = mocker.patch("time.monotonic_ns")
+        # patched where meta looks it up, not where it is defined
+        mock_truncate = mocker.patch(meta.__name__ + ".value_to_truncated_string")
 
         # Set up time mock to simulate rapid calls (within threshold)
-        mock_time.side_effect = [1000.0, 1000.5, 1000.5, 1000.6]
+        # first call: start and end, second call: start only
+        mock_time.side_effect = [
+            1_000_000_000_000,
+            1_000_500_000_000,
+            1_000_500_000_000,
+        ]
 
         # Create a test function
         def test_func(self: object) -> str:  # noqa: ARG001
@@ -164,6 +227,7 @@ class TestABCLoggingMeta:
         # First call - should log
         wrapped_func(mock_self)
         first_call_count = mock_logger.info.call_count
+        first_truncate_count = mock_truncate.call_count
 
         # Second call within threshold - should not log
         wrapped_func(mock_self)
@@ -173,3 +237,110 @@ class TestABCLoggingMeta:
         assert second_call_count == first_call_count, (
             "Expected no additional logging due to rate limiting"
         )
+        assert mock_truncate.call_count == first_truncate_count, (
+            "Expected no values to be formatted for a rate limited call"
+        )
+
+    def test_wrap_with_logging_none_result(self, mocker: MockFixture) -> None:
+        """Test that wrap_with_logging does not format None results."""
+        mock_logger = mocker.patch(meta.__name__ + ".logger")
+        mock_truncate = mocker.patch(meta.__name__ + ".value_to_truncated_string")
+
+        def test_func(self: object) -> None:
+            pass
+
+        wrapped_func = ABCLoggingMeta.wrap_with_logging(
+            test_func,
+            "TestClass",
+            {},
+        )
+        wrapped_func(mocker.MagicMock())
+
+        # only args and kwargs are formatted, the result is logged as is
+        expected_truncate_calls = 2
+        assert mock_truncate.call_count == expected_truncate_calls, (
+            f"Expected {expected_truncate_calls} calls, got {mock_truncate.call_count}"
+        )
+        finished_args = mock_logger.info.call_args.args
+        assert finished_args[-1] == "None", (
+            f"Expected 'None' to be logged, got {finished_args[-1]}"
+        )
+
+    def test_wrap_with_logging_disabled_logger(self, mocker: MockFixture) -> None:
+        """Test that wrap_with_logging does no work if INFO is disabled."""
+        mock_logger = mocker.patch(meta.__name__ + ".logger")
+        mock_logger.isEnabledFor.return_value = False
+        mock_time = mocker.patch("time.monotonic_ns")
+        mock_truncate = mocker.patch(meta.__name__ + ".value_to_truncated_string")
+
+        def test_func(self: object) -> str:  # noqa: ARG001
+            return "result"
+
+        call_times: dict[str, float] = {}
+        wrapped_func = ABCLoggingMeta.wrap_with_logging(
+            test_func,
+            "TestClass",
+            call_times,
+        )
+
+        result = wrapped_func(mocker.MagicMock())
+        assert result == "result", f"Expected 'result', got {result}"
+
+        mock_logger.isEnabledFor.assert_called_once_with(logging.INFO)
+        mock_logger.info.assert_not_called()
+        mock_time.assert_not_called()
+        mock_truncate.assert_not_called()
+        assert not call_times, "Expected no call time to be recorded"
+
+    def test_wrap_with_logging_rate_limits_across_threads(
+        self,
+        mocker: MockFixture,
+    ) -> None:
+        """Test that wrap_with_logging shares its rate limit between threads."""
+        mock_logger = mocker.patch(meta.__name__ + ".logger")
+
+        def test_func(self: object) -> str:  # noqa: ARG001
+            return "result"
+
+        wrapped_func = ABCLoggingMeta.wrap_with_logging(
+            test_func,
+            "TestClass",
+            {},
+        )
+
+        # the first call logs
+        wrapped_func(None)
+        calls_per_first_call = mock_logger.info.call_count
+
+        # a call from another thread within the threshold is rate limited
+        thread = threading.Thread(target=wrapped_func, args=(None,))
+        thread.start()
+        thread.join()
+        assert mock_logger.info.call_count == calls_per_first_call, (
+            "Expected the call in another thread to be rate limited"
+        )
+
+
+def test_no_logging(mocker: MockFixture) -> None:
+    """Test func for no_logging."""
+    mock_logger = mocker.patch(meta.__name__ + ".logger")
+
+    def method(self: object) -> str:  # noqa: ARG001
+        return "result"
+
+    assert no_logging(method) is method, "Expected the same method back"
+    assert getattr(method, "__no_logging__", False), "Expected the method marked"
+
+    class TestClass(metaclass=ABCLoggingMeta):
+        @no_logging
+        def hot_method(self) -> str:
+            return "hot"
+
+        @classmethod
+        @no_logging
+        def hot_classmethod(cls) -> str:
+            return "hot"
+
+    assert TestClass().hot_method() == "hot"
+    assert TestClass.hot_classmethod() == "hot"
+    mock_logger.info.assert_not_called()
@@ -3,15 +3,21 @@
 import pytest
 from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from pytest_mock import MockerFixture
 
+from winiutils.core.security import cryptography
 from winiutils.core.security.cryptography import (
     IV_LEN,
+    STREAM_CHUNK_SIZE,
+    TAG_LEN,
     decrypt_with_aes_gcm,
+    encrypt_stream_with_aes_gcm,
     encrypt_with_aes_gcm,
+    encrypt_with_aes_gcm_into,
 )
 
 
-def test_encrypt_with_aes_gcm() -> None:
+def test_encrypt_with_aes_gcm(mocker: MockerFixture) -> None:
     """Test func for encrypt_with_aes_gcm."""
     # Create an AESGCM instance for testing
     key = AESGCM.generate_key(bit_length=256)
@@ -20,8 +26,10 @@ def test_encrypt_with_aes_gcm() -> None:
     # Test data
     test_data = b"Hello, World! This is test data for encryption."
 
-    # Test encryption without AAD
+    # Test encryption without AAD, the one-shot path never uses the buffer API
+    encrypt_into = mocker.spy(cryptography, "encrypt_with_aes_gcm_into")
     encrypted_result = encrypt_with_aes_gcm(aes_gcm, test_data)
+    encrypt_into.assert_not_called()
 
     # Verify the result is bytes
     assert isinstance(encrypted_result, bytes), (
@@ -40,6 +48,16 @@ def test_encrypt_with_aes_gcm() -> None:
         f"got {len(encrypted_result)}"
     )
 
+    # Verify the layout is IV + ciphertext + tag and readable by AESGCM itself
+    expected_len = IV_LEN + len(test_data) + TAG_LEN
+    assert len(encrypted_result) == expected_len, (
+        f"Expected {expected_len} bytes, got {len(encrypted_result)}"
+    )
+    iv, ciphertext = encrypted_result[:IV_LEN], encrypted_result[IV_LEN:]
+    assert aes_gcm.decrypt(iv, ciphertext, None) == test_data, (
+        "Expected AESGCM to decrypt the ciphertext behind the IV"
+    )
+
     # Test encryption with AAD
     test_aad = b"additional_authenticated_data"
     encrypted_with_aad = encrypt_with_aes_gcm(aes_gcm, test_data, test_aad)
@@ -70,6 +88,37 @@ def test_encrypt_with_aes_gcm() -> None:
     )
 
 
+def test_encrypt_with_aes_gcm_into() -> None:
+    """Test func for encrypt_with_aes_gcm_into."""
+    key = AESGCM.generate_key(bit_length=256)
+    aes_gcm = AESGCM(key)
+    test_data = b"Hello, World! This is test data for encryption."
+    test_aad = b"additional_authenticated_data"
+    size = IV_LEN + len(test_data) + TAG_LEN
+
+    # Bytes behind the written range stay untouched
+    out = bytearray(b"\xff" * (size + 8))
+    written = encrypt_with_aes_gcm_into(aes_gcm, test_data, out, test_aad)
+    assert written == size, f"Expected {size} bytes written, got {written}"
+    assert out[size:] == b"\xff" * 8, "Expected the rest of the buffer unchanged"
+
+    decrypted = decrypt_with_aes_gcm(aes_gcm, bytes(out[:written]), test_aad)
+    assert decrypted == test_data, (
+        f"Expected data to round-trip, got {decrypted!r} vs {test_data!r}"
+    )
+
+    # Writing into a slice of a larger message
+    message = bytearray(4 + size)
+    written = encrypt_with_aes_gcm_into(aes_gcm, test_data, memoryview(message)[4:])
+    assert decrypt_with_aes_gcm(aes_gcm, message[4 : 4 + written]) == test_data, (
+        "Expected data written into a memoryview slice to round-trip"
+    )
+
+    # Too small buffers are rejected
+    with pytest.raises(ValueError, match="are needed"):
+        encrypt_with_aes_gcm_into(aes_gcm, test_data, bytearray(size - 1))
+
+
 def test_decrypt_with_aes_gcm() -> None:
     """Test func for decrypt_with_aes_gcm."""
     # Create an AESGCM instance for testing
@@ -128,3 +177,46 @@ def test_decrypt_with_aes_gcm() -> None:
         f"Expected decrypted large data to match original, "
         f"got length {len(decrypted_large)} vs {len(large_data)}"
     )
+
+
+def test_encrypt_stream_with_aes_gcm() -> None:
+    """Test func for encrypt_stream_with_aes_gcm."""
+    key = AESGCM.generate_key(bit_length=256)
+    aes_gcm = AESGCM(key)
+
+    # Many small chunks spanning several stream blocks
+    test_data = b"0123456789abcdef" * (STREAM_CHUNK_SIZE // 8 + 3)
+    small_chunks = [test_data[i : i + 100] for i in range(0, len(test_data), 100)]
+    test_aad = b"additional_authenticated_data"
+    encrypted_chunks = list(
+        encrypt_stream_with_aes_gcm(key, small_chunks, test_aad),
+    )
+
+    # IV first, tag last and full blocks in between
+    assert len(encrypted_chunks[0]) == IV_LEN, (
+        f"Expected the IV first, got {len(encrypted_chunks[0])} bytes"
+    )
+    assert len(encrypted_chunks[-1]) == TAG_LEN, (
+        f"Expected the tag last, got {len(encrypted_chunks[-1])} bytes"
+    )
+    block_sizes = [len(chunk) for chunk in encrypted_chunks[1:-2]]
+    assert block_sizes == [STREAM_CHUNK_SIZE, STREAM_CHUNK_SIZE], (
+        f"Expected two full stream blocks, got sizes {block_sizes}"
+    )
+
+    # The joined stream has the format of encrypt_with_aes_gcm
+    encrypted = b"".join(encrypted_chunks)
+    decrypted = decrypt_with_aes_gcm(aes_gcm, encrypted, test_aad)
+    assert decrypted == test_data, (
+        f"Expected streamed data to round-trip, got length {len(decrypted)}"
+    )
+
+    # Wrong AAD is detected
+    with pytest.raises(InvalidTag):
+        decrypt_with_aes_gcm(aes_gcm, encrypted, b"wrong_aad")
+
+    # Empty stream without AAD
+    encrypted_empty = b"".join(encrypt_stream_with_aes_gcm(key, []))
+    assert decrypt_with_aes_gcm(aes_gcm, encrypted_empty) == b"", (
+        "Expected an empty stream to round-trip"
+    )
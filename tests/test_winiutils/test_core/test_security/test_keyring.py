@@ -3,14 +3,18 @@
 import uuid
 from collections.abc import Callable
 
+import keyring
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from pytest_mock import MockerFixture
 
 from winiutils.core.security.keyring import (
+    get_key_as_bytes,
     get_key_as_str,
     get_or_create_aes_gcm,
     get_or_create_fernet,
     get_or_create_key,
+    invalidate_key_cache,
     make_service_name,
 )
 
@@ -45,7 +49,10 @@ def test_get_or_create_aes_gcm(keyring_cleanup: Callable[[str, str], None]) -> N
     assert key == key2
 
 
-def test_get_or_create_key(keyring_cleanup: Callable[[str, str], None]) -> None:
+def test_get_or_create_key(
+    keyring_cleanup: Callable[[str, str], None],
+    mocker: MockerFixture,
+) -> None:
     """Test get_or_create_key with custom key class."""
     keyring_cleanup(f"{SERVICE_NAME}_AESGCM", USERNAME)
 
@@ -58,6 +65,34 @@ def test_get_or_create_key(keyring_cleanup: Callable[[str, str], None]) -> None:
     assert isinstance(aesgcm, AESGCM)
     assert len(key) == AES_256_KEY_BYTES
 
+    # later calls are served from the cache without touching the keyring
+    get_password = mocker.spy(keyring, "get_password")
+    cached = get_or_create_key(SERVICE_NAME, USERNAME, AESGCM, AESGCM.generate_key)
+    assert cached == (aesgcm, key)
+    get_password.assert_not_called()
+
+
+def test_invalidate_key_cache(
+    keyring_cleanup: Callable[[str, str], None],
+    mocker: MockerFixture,
+) -> None:
+    """Test invalidate_key_cache forces the next lookup to the keyring."""
+    keyring_cleanup(f"{SERVICE_NAME}_Fernet", USERNAME)
+
+    _, key = get_or_create_fernet(SERVICE_NAME, USERNAME)
+    get_password = mocker.spy(keyring, "get_password")
+
+    # other services and usernames are not affected
+    invalidate_key_cache("other_service")
+    invalidate_key_cache(SERVICE_NAME, "other_user")
+    get_or_create_fernet(SERVICE_NAME, USERNAME)
+    get_password.assert_not_called()
+
+    invalidate_key_cache(SERVICE_NAME, USERNAME)
+    _, key2 = get_or_create_fernet(SERVICE_NAME, USERNAME)
+    get_password.assert_called_once()
+    assert key == key2
+
 
 def test_get_key_as_str(keyring_cleanup: Callable[[str, str], None]) -> None:
     """Test get_key_as_str returns stored key string."""
@@ -70,7 +105,22 @@ def test_get_key_as_str(keyring_cleanup: Callable[[str, str], None]) -> None:
     assert result is not None
 
 
+def test_get_key_as_bytes(keyring_cleanup: Callable[[str, str], None]) -> None:
+    """Test get_key_as_bytes returns the decoded stored key."""
+    keyring_cleanup(f"{SERVICE_NAME}_AESGCM", USERNAME)
+
+    assert get_key_as_bytes(SERVICE_NAME, USERNAME, AESGCM) is None
+
+    _, key = get_or_create_aes_gcm(SERVICE_NAME, USERNAME)
+    assert get_key_as_bytes(SERVICE_NAME, USERNAME, AESGCM) == key
+
+
 def test_make_service_name() -> None:
     """Test make_service_name combines service and class name."""
     assert make_service_name("my_service", Fernet) == "my_service_Fernet"
     assert make_service_name("my_service", AESGCM) == "my_service_AESGCM"
+
+    # repeated calls are answered from the cache
+    hits = make_service_name.cache_info().hits
+    assert make_service_name("my_service", Fernet) == "my_service_Fernet"
+    assert make_service_name.cache_info().hits == hits + 1